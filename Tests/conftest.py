@@ -2,39 +2,109 @@
 Pytest configuration and shared fixtures.
 """
 
-import json
-from pathlib import Path
+from functools import lru_cache
+from hashlib import blake2s
+from pathlib import Path, PurePosixPath
 
 import pytest
 
+from renamer.operations import OutputFormat
 
-@pytest.fixture
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+try:
+    # Optional: orjson parses faster; stdlib json is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@lru_cache(maxsize=1)
+def load_corpus() -> dict:
+    """Read and parse filenames.json (once per pytest run)."""
+    return _json_loads((FIXTURES_DIR / "filenames.json").read_bytes())
+
+
+def corpus_cases(section: str) -> list[dict]:
+    """
+    Flatten one corpus section into a list of cases.
+
+    Each case gets a "category" key naming the group it came from.
+    Keys starting with "_" are comments and are skipped.
+    """
+    cases = []
+    for category, entries in load_corpus()[section].items():
+        if category.startswith("_"):
+            continue
+        for entry in entries:
+            cases.append({**entry, "category": category})
+    return cases
+
+
+def case_ids(cases: list[dict]) -> list[str]:
+    """
+    Short, stable test IDs: the category plus a hash of the case's input.
+
+    Raw filenames make long IDs full of spaces and brackets, which are
+    awkward to pass to -k or to see in pytest-xdist worker reports.
+    Hashing the input (rather than numbering cases) keeps an ID pointing
+    at the same filename when corpus entries are added or reordered.
+    The filename is still printed by each test.
+    """
+    return [
+        f"{case['category']}-{blake2s(case['input'].encode(), digest_size=4).hexdigest()}"
+        for case in cases
+    ]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize `episode_case` tests with every episode pattern in the corpus."""
+    if "episode_case" in metafunc.fixturenames:
+        cases = corpus_cases("episode_patterns")
+        metafunc.parametrize("episode_case", cases, ids=case_ids(cases))
+
+
+# The corpus is read-only data, so every fixture here is session-scoped.
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Path to the fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_DIR
 
 
-@pytest.fixture
-def test_corpus(fixtures_dir: Path) -> dict:
+@pytest.fixture(scope="session")
+def test_corpus() -> dict:
     """Load the full test corpus from filenames.json."""
-    corpus_path = fixtures_dir / "filenames.json"
-    with open(corpus_path) as f:
-        return json.load(f)
+    return load_corpus()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def episode_patterns(test_corpus: dict) -> dict:
     """Just the episode pattern test cases."""
     return test_corpus["episode_patterns"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def title_cleaning_cases(test_corpus: dict) -> dict:
     """Just the title cleaning test cases."""
     return test_corpus["title_cleaning"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_detection_cases(test_corpus: dict) -> dict:
     """Just the series detection test cases."""
     return test_corpus["series_detection"]
+
+
+@pytest.fixture(scope="session")
+def fake_path() -> PurePosixPath:
+    """Placeholder base path for formats that don't use folder detection."""
+    # Pure path: it never touches the filesystem
+    return PurePosixPath("/fake/path")
+
+
+@pytest.fixture(scope="session")
+def default_format() -> str:
+    """The CLI's default output format."""
+    return OutputFormat.SHOW_SXXEXX_TITLE
@@ -6,9 +6,12 @@ These tests verify the complete pipeline: messy filename -> clean output.
 
 import pytest
 from renamer.cleaner import clean_title
-from renamer.parser import get_season_episode, EpisodeInfo
+from renamer.parser import get_season_episode, EpisodeInfo, detect_series_name_no_year
 from renamer.operations import get_episode_title, build_filename
-from pathlib import Path
+from pathlib import PurePosixPath
+
+# Fake series folder for the default-format tests (never touches the filesystem)
+FAKE_PLURIBUS_PATH = PurePosixPath("/fake/Pluribus (2025)")
 
 
 class TestTitleCleaning:
@@ -34,6 +37,7 @@ class TestTitleCleaning:
         ("Title-DIMENSION", "Title"),
         ("Title-LOL", "Title"),
         ("Title-YTS", "Title"),
+        ("Title.-.-.720p", "Title"),  # leftover separator dashes
 
         # Preserve meaningful content
         ("What...", "What..."),
@@ -87,12 +91,20 @@ class TestFullTransformation:
             "Cyberpunk Edgerunners (2022)",
             "Cyberpunk Edgerunners (2022) - S01E01.mkv"
         ),
+    ], ids=[
+        "breaking_bad",
+        "doctor_who",
+        "the_office_no_title",
+        "xvid_boundary",
+        "pluribus_parens",
+        "anime_erai_raws",
     ])
     def test_full_transformation(
         self,
         input_filename: str,
         series_name: str,
-        expected_output: str
+        expected_output: str,
+        fake_path: PurePosixPath,
     ):
         """Test the complete input -> output transformation."""
         # Determine if anime mode
@@ -111,14 +123,14 @@ class TestFullTransformation:
         )
 
         # Build filename
-        extension = Path(input_filename).suffix.lstrip('.')
+        extension = input_filename.rpartition('.')[2]
         result = build_filename(
             episode_info,
             title if title else None,
             extension,
             series_name,
             "Show (Year) - SxxExx - Title",
-            Path("/fake/path"),  # Not used for this format
+            detect_series_name_no_year(fake_path),  # Not used for this format
         )
 
         print(f"{input_filename}")
@@ -131,10 +143,8 @@ class TestFullTransformation:
 class TestDefaultFormat:
     """Test with the default 'Show - SxxExx - Title' format (no year in output)."""
 
-    def test_pluribus_default_format(self):
+    def test_pluribus_default_format(self, default_format: str):
         """Real-world test: Pluribus files with default format."""
-        from renamer.operations import OutputFormat
-
         input_filename = "Pluribus (2025) - S01E01 - We Is Us (1080p ATVP WEB-DL x265 Ghost).mkv"
         series_name = "Pluribus (2025)"
         expected_output = "Pluribus - S01E01 - We Is Us.mkv"
@@ -144,14 +154,14 @@ class TestDefaultFormat:
 
         title = get_episode_title(input_filename, episode_info, series_name, set())
 
-        extension = Path(input_filename).suffix.lstrip('.')
+        extension = input_filename.rpartition('.')[2]
         result = build_filename(
             episode_info,
             title if title else None,
             extension,
             series_name,
-            OutputFormat.SHOW_SXXEXX_TITLE,  # Default format
-            Path("/fake/Pluribus (2025)"),
+            default_format,
+            detect_series_name_no_year(FAKE_PLURIBUS_PATH),
         )
 
         print(f"{input_filename}")
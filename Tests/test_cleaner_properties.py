@@ -0,0 +1,57 @@
+"""
+Property-based tests for title cleaning.
+
+These run in the opt-in slow lane (`pytest -m slow`) and need hypothesis.
+The hand-picked cases in test_cleaner.py remain the everyday check.
+"""
+
+import re
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, strategies as st
+
+from renamer.cleaner import clean_title
+
+
+# Technical suffixes that mark the end of the title
+SUFFIXES = [
+    "720p", "1080p", "2160p", "WEB-DL", "BluRay", "HDTV",
+    "x264", "x265", "HEVC", "XviD", "DivX", "AMZN", "NFLX",
+]
+
+# Words the cleaner strips on purpose wherever they appear
+# (platforms, audio, tags, file extensions), so they can't be title words
+RESERVED_WORDS = {
+    "web", "dl", "dd", "ddp", "nf", "max", "hbo", "hmax", "hulu", "dsnp",
+    "amzn", "nflx", "aac", "dts",
+    "fixed", "repack", "proper", "internal", "extended", "uncut",
+    "directors", "cut", "dubbed", "subbed",
+    "mkv", "mp4", "avi", "m4v", "mov", "wmv", "flv", "webm", "ts", "m2ts",
+}
+
+# A title starting with one of these is treated as pure metadata
+# (known limitation: "Webster.720p" cleans to "")
+TECH_PREFIX = re.compile(
+    r'(720p|1080p|2160p|4K|WEB|BluRay|HDTV|x264|x265|HEVC|XviD|DivX)',
+    re.IGNORECASE
+)
+
+title_words = st.text(
+    alphabet=st.sampled_from("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"),
+    min_size=1,
+    max_size=8,
+).filter(lambda w: w.lower() not in RESERVED_WORDS and not TECH_PREFIX.match(w))
+
+
+@pytest.mark.slow
+class TestCleanTitleProperties:
+    """Invariants of clean_title over generated titles."""
+
+    @given(st.lists(title_words, min_size=1, max_size=4), st.sampled_from(SUFFIXES))
+    def test_strips_suffix_and_keeps_title(self, words: list[str], suffix: str):
+        """A dotted title followed by a technical suffix cleans to the spaced title."""
+        filename = ".".join(words) + "." + suffix
+        result = clean_title(filename)
+        assert result == " ".join(words), f'"{filename}" -> "{result}"'
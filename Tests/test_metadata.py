@@ -0,0 +1,419 @@
+"""
+Tests for internal metadata cleaning.
+
+External tools are never invoked: MP4 titles are read from synthetic
+atoms, and the other probes and the ffmpeg call are stubbed so the
+decision logic runs without ffmpeg, mkvpropedit or mediainfo installed.
+"""
+
+import struct
+import subprocess
+from pathlib import Path
+
+import pytest
+from renamer import metadata
+from renamer.metadata import (
+    MkvTrack,
+    clean_metadata,
+    clean_metadata_batch,
+    clean_mkv_metadata,
+    clean_mp4_metadata,
+    title_needs_cleaning,
+)
+
+
+class TestTitleNeedsCleaning:
+    """Test detection of technical junk in an existing container title."""
+
+    @pytest.mark.parametrize("current_title,clean_title,expected", [
+        # Nothing to clean
+        ("", "Show - S01E01 - Pilot", False),
+        ("Show - S01E01 - Pilot", "Show - S01E01 - Pilot", False),
+        ("Show - S01E01", "Show - S01E01 - Pilot", False),  # prefix of the clean name
+
+        # Technical indicators
+        ("Show.S01E01.Pilot.1080p.WEB-DL.x264-GROUP", "Show - S01E01 - Pilot", True),
+        ("Pilot HEVC", "Show - S01E01 - Pilot", True),
+        ("Pilot (H.264 AAC)", "Show - S01E01 - Pilot", True),
+
+        # No indicators, but doesn't match the clean name either
+        ("Some Other Title", "Show - S01E01 - Pilot", True),
+    ])
+    def test_title_needs_cleaning(self, current_title: str, clean_title: str, expected: bool):
+        result = title_needs_cleaning(current_title, clean_title)
+        print(f'"{current_title}" vs "{clean_title}" -> {result}')
+        assert result == expected
+
+
+@pytest.fixture
+def stub_mp4_tools(monkeypatch: pytest.MonkeyPatch):
+    """
+    Pretend ffmpeg is installed and report a fixed current title.
+
+    Returns a dict: set "title" to control what the probe reports; every
+    ffmpeg command line is appended to "calls".
+    """
+    state = {"title": "", "calls": []}
+
+    def fake_run(cmd, **kwargs):
+        state["calls"].append(cmd)
+        # ffmpeg writes its output to the last argument
+        Path(cmd[-1]).write_bytes(b"remuxed")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(metadata, "has_ffmpeg", lambda: True)
+    monkeypatch.setattr(metadata, "get_mp4_title", lambda path: state["title"])
+    monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+    return state
+
+
+class TestCleanMp4Metadata:
+    """Test the MP4 cleaning flow with stubbed ffprobe/ffmpeg."""
+
+    def test_dirty_title_dry_run(self, tmp_path: Path, stub_mp4_tools: dict):
+        """Dry run reports the change but never runs ffmpeg."""
+        video = tmp_path / "Show - S01E01 - Pilot.mp4"
+        video.write_bytes(b"original")
+        stub_mp4_tools["title"] = "Show.S01E01.Pilot.1080p.WEB-DL.x264-GROUP"
+
+        result = clean_mp4_metadata(video, "Show - S01E01 - Pilot", dry_run=True)
+        print(result.message)
+
+        assert result.success and result.changed
+        assert stub_mp4_tools["calls"] == []
+        assert video.read_bytes() == b"original"
+
+    def test_dirty_title_is_remuxed(self, tmp_path: Path, stub_mp4_tools: dict):
+        """The remuxed temp file replaces the original."""
+        video = tmp_path / "Show - S01E01 - Pilot.mp4"
+        video.write_bytes(b"original")
+        stub_mp4_tools["title"] = "Show.S01E01.Pilot.1080p.WEB-DL.x264-GROUP"
+
+        result = clean_mp4_metadata(video, "Show - S01E01 - Pilot")
+        print(result.message)
+
+        assert result.success and result.changed
+        assert len(stub_mp4_tools["calls"]) == 1
+        assert "title=Show - S01E01 - Pilot" in stub_mp4_tools["calls"][0]
+        cmd = stub_mp4_tools["calls"][0]
+        assert cmd[cmd.index("-threads") + 1] == "1"
+        assert video.read_bytes() == b"remuxed"
+        assert list(tmp_path.iterdir()) == [video]  # temp file consumed
+
+    @pytest.mark.parametrize("failure", ["exit", "timeout"])
+    def test_failed_remux_leaves_no_temp_file(
+        self, tmp_path: Path, stub_mp4_tools: dict, monkeypatch: pytest.MonkeyPatch, failure: str
+    ):
+        video = tmp_path / "Show - S01E01 - Pilot.mp4"
+        video.write_bytes(b"original")
+        stub_mp4_tools["title"] = "Show.S01E01.Pilot.1080p.WEB-DL.x264-GROUP"
+
+        def failing_run(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"partial")
+            if failure == "timeout":
+                raise subprocess.TimeoutExpired(cmd, 300)
+            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="boom")
+
+        monkeypatch.setattr(metadata.subprocess, "run", failing_run)
+        result = clean_mp4_metadata(video, "Show - S01E01 - Pilot")
+        print(result.message)
+
+        assert not result.success
+        assert video.read_bytes() == b"original"
+        assert list(tmp_path.iterdir()) == [video]
+
+    @pytest.mark.parametrize("current_title", ["", "Show - S01E01 - Pilot"])
+    def test_clean_title_is_skipped(self, tmp_path: Path, stub_mp4_tools: dict, current_title: str):
+        video = tmp_path / "Show - S01E01 - Pilot.mp4"
+        video.write_bytes(b"original")
+        stub_mp4_tools["title"] = current_title
+
+        result = clean_mp4_metadata(video, "Show - S01E01 - Pilot")
+        print(result.message)
+
+        assert result.success and not result.changed
+        assert stub_mp4_tools["calls"] == []
+
+    def test_missing_ffmpeg(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(metadata, "has_ffmpeg", lambda: False)
+        result = clean_mp4_metadata(tmp_path / "video.mp4", "Title")
+        assert not result.success
+        assert result.message == "ffmpeg not found"
+
+
+@pytest.fixture
+def stub_mkv_tools(monkeypatch: pytest.MonkeyPatch):
+    """
+    Pretend mkvpropedit is installed and the file has three tracks, two
+    of them named.
+
+    Returns a dict: set "returncodes" to the exit codes mkvpropedit should
+    give, in order (0 once the list runs out); every command line is
+    appended to "calls".
+    """
+    state = {"returncodes": [], "calls": []}
+
+    def fake_run(cmd, **kwargs):
+        state["calls"].append(cmd)
+        code = state["returncodes"].pop(0) if state["returncodes"] else 0
+        return subprocess.CompletedProcess(cmd, code, stdout="", stderr="")
+
+    monkeypatch.setattr(metadata, "has_mkvpropedit", lambda: True)
+    monkeypatch.setattr(metadata, "get_mkv_tracks", lambda path, stat=None: [
+        MkvTrack(id=0, number=1, type="video", name="Show.S01E01.1080p-GRP"),
+        MkvTrack(id=1, number=2, type="audio", name="English"),
+        MkvTrack(id=2, number=3, type="subtitles"),
+    ])
+    monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+    return state
+
+
+class TestCleanMkvMetadata:
+    """Test the MKV cleaning flow with stubbed mkvpropedit."""
+
+    @pytest.mark.parametrize("returncode", [0, 1])
+    def test_single_run(self, stub_mkv_tools: dict, returncode: int):
+        """Title, tags and every named track go in one mkvpropedit run."""
+        stub_mkv_tools["returncodes"] = [returncode]
+        result = clean_mkv_metadata(Path("/fake/video.mkv"), "Show - S01E01 - Pilot")
+        print(stub_mkv_tools["calls"])
+
+        assert result.success and result.changed
+        assert len(stub_mkv_tools["calls"]) == 1
+        cmd = stub_mkv_tools["calls"][0]
+        assert "title=Show - S01E01 - Pilot" in cmd
+        assert "track:@1" in cmd and "track:@2" in cmd
+        assert "track:@3" not in cmd  # no name to delete
+
+    def test_falls_back_to_separate_runs(self, stub_mkv_tools: dict):
+        """A failed combined run is retried as container + one run per named track."""
+        stub_mkv_tools["returncodes"] = [2]
+        result = clean_mkv_metadata(Path("/fake/video.mkv"), "Show - S01E01 - Pilot")
+        print(stub_mkv_tools["calls"])
+
+        assert result.success and result.changed
+        assert len(stub_mkv_tools["calls"]) == 4
+
+    def test_dry_run(self, stub_mkv_tools: dict):
+        result = clean_mkv_metadata(Path("/fake/video.mkv"), "Title", dry_run=True)
+        assert result.success and result.changed
+        assert stub_mkv_tools["calls"] == []
+
+
+class TestToolProbes:
+    """Test that tool lookups search PATH once until reset."""
+
+    def test_which_is_cached(self, monkeypatch: pytest.MonkeyPatch):
+        lookups = []
+
+        def fake_which(name):
+            lookups.append(name)
+            return f"/usr/bin/{name}"
+
+        monkeypatch.setattr(metadata.shutil, "which", fake_which)
+        metadata.reset_tool_cache()
+        try:
+            assert metadata.has_ffmpeg() and metadata.has_ffmpeg()
+            assert lookups == ["ffmpeg"]
+
+            metadata.reset_tool_cache()
+            metadata.has_ffmpeg()
+            assert lookups == ["ffmpeg", "ffmpeg"]
+        finally:
+            metadata.reset_tool_cache()
+
+
+# Trimmed mkvmerge -J output
+MKVMERGE_JSON = b"""{
+  "container": {"type": "Matroska", "properties": {"title": "Show.S01E01.1080p-GRP"}},
+  "tracks": [
+    {"id": 0, "type": "video", "codec": "AVC/H.264/MPEG-4p10",
+     "properties": {"number": 1, "track_name": "Show.S01E01.1080p-GRP"}},
+    {"id": 1, "type": "audio", "codec": "AAC", "properties": {"number": 2}}
+  ]
+}"""
+
+
+class TestParseMkvTracks:
+    """Test parsing mkvmerge -J output without running mkvmerge."""
+
+    def test_parse(self):
+        tracks = metadata.parse_mkv_tracks(MKVMERGE_JSON)
+        print(metadata.format_mkv_tracks(tracks))
+        assert [(t.id, t.number, t.type, t.name) for t in tracks] == [
+            (0, 1, "video", "Show.S01E01.1080p-GRP"),
+            (1, 2, "audio", ""),
+        ]
+
+    @pytest.mark.parametrize("output", [b"", b"not json", b"[]", b'{"tracks": [{}]}'])
+    def test_bad_output(self, output: bytes):
+        assert metadata.parse_mkv_tracks(output) == []
+
+
+class TestMkvTrackInfoCache:
+    """Test that mkvmerge runs once per file version."""
+
+    def test_probe_is_cached_until_file_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout=MKVMERGE_JSON, stderr=b"")
+
+        monkeypatch.setattr(metadata, "has_mkvmerge", lambda: True)
+        monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+        metadata.clear_track_cache()
+        video = tmp_path / "video.mkv"
+        video.write_bytes(b"original")
+
+        assert metadata.get_mkv_track_info(video) == (
+            'Track ID 0: video (AVC/H.264/MPEG-4p10) "Show.S01E01.1080p-GRP"\n'
+            'Track ID 1: audio (AAC)'
+        )
+        assert metadata.get_mkv_track_ids(video) == [0, 1]
+        assert [(t.number, t.name) for t in metadata.get_mkv_tracks(video)] == [
+            (1, "Show.S01E01.1080p-GRP"), (2, ""),
+        ]
+        assert len(calls) == 1
+
+        metadata.clear_track_cache()
+        metadata.get_mkv_track_ids(video)
+        assert len(calls) == 2
+
+        # A stat result from the caller is used instead of a fresh stat
+        metadata.get_mkv_tracks(video, stat=video.stat())
+        assert len(calls) == 2
+
+
+def atom(kind: bytes, *children: bytes) -> bytes:
+    """Build an MP4 atom: 32-bit size, 4-byte type, body."""
+    body = b"".join(children)
+    return struct.pack(">I4s", 8 + len(body), kind) + body
+
+
+def data_atom(text: str) -> bytes:
+    """An ilst 'data' atom holding UTF-8 text."""
+    return atom(b"data", b"\x00\x00\x00\x01", b"\x00\x00\x00\x00", text.encode())
+
+
+def mp4_file(path: Path, moov: bytes) -> Path:
+    """Write ftyp + a large mdat + moov, in the order a streamed file has them."""
+    path.write_bytes(
+        atom(b"ftyp", b"isom\x00\x00\x02\x00isomiso2mp41")
+        + atom(b"mdat", b"\x00" * 4096)
+        + atom(b"moov", moov)
+    )
+    return path
+
+
+class TestGetMp4Title:
+    """Test reading the title straight from MP4 atoms, without mediainfo."""
+
+    @pytest.fixture(autouse=True)
+    def no_mediainfo(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(metadata, "has_mediainfo", lambda: False)
+
+    def test_ilst_title(self, tmp_path: Path):
+        """The layout ffmpeg writes: udta/meta/hdlr + ilst/©nam/data."""
+        meta = atom(b"meta", b"\x00" * 4, atom(b"hdlr", b"\x00" * 25),
+                    atom(b"ilst", atom(b"\xa9nam", data_atom("Show.S01E01.1080p-GRP"))))
+        video = mp4_file(tmp_path / "video.mp4", atom(b"mvhd", b"\x00" * 100) + atom(b"udta", meta))
+        assert metadata.get_mp4_title(video) == "Show.S01E01.1080p-GRP"
+
+    def test_quicktime_udta_title(self, tmp_path: Path):
+        text = "Old Style".encode()
+        nam = atom(b"\xa9nam", struct.pack(">HH", len(text), 0x55C4), text)
+        video = mp4_file(tmp_path / "video.mp4", atom(b"udta", nam))
+        assert metadata.get_mp4_title(video) == "Old Style"
+
+    def test_mdta_keys_title(self, tmp_path: Path):
+        keys = atom(b"keys", struct.pack(">II", 0, 2),
+                    struct.pack(">I4s", 8 + 26, b"mdta"), b"com.apple.quicktime.artist",
+                    struct.pack(">I4s", 8 + 25, b"mdta"), b"com.apple.quicktime.title")
+        ilst = atom(b"ilst",
+                    atom(struct.pack(">I", 1), data_atom("Artist")),
+                    atom(struct.pack(">I", 2), data_atom("Keyed Title")))
+        meta = atom(b"meta", atom(b"hdlr", b"\x00" * 25), keys, ilst)
+        video = mp4_file(tmp_path / "video.mp4", meta)
+        assert metadata.get_mp4_title(video) == "Keyed Title"
+
+    def test_udta_mdta_plain_title_key(self, tmp_path: Path):
+        """The layout ffmpeg writes with -movflags use_metadata_tags."""
+        keys = atom(b"keys", struct.pack(">II", 0, 2),
+                    struct.pack(">I4s", 8 + 7, b"mdta"), b"encoder",
+                    struct.pack(">I4s", 8 + 5, b"mdta"), b"title")
+        ilst = atom(b"ilst",
+                    atom(struct.pack(">I", 1), data_atom("Lavf60.16.100")),
+                    atom(struct.pack(">I", 2), data_atom("Show.S01E01.1080p-GRP")))
+        meta = atom(b"meta", b"\x00" * 4, atom(b"hdlr", b"\x00" * 8 + b"mdta" + b"\x00" * 13), keys, ilst)
+        video = mp4_file(tmp_path / "video.mp4", atom(b"udta", meta))
+        assert metadata.get_mp4_title(video) == "Show.S01E01.1080p-GRP"
+
+    def test_unresolved_keyed_ilst_falls_back_to_mediainfo(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """A keyed ilst without a known title key isn't reported as "no title"."""
+        keys = atom(b"keys", struct.pack(">II", 0, 1),
+                    struct.pack(">I4s", 8 + 11, b"mdta"), b"com.example")
+        ilst = atom(b"ilst", atom(struct.pack(">I", 1), data_atom("Something")))
+        meta = atom(b"meta", b"\x00" * 4, atom(b"hdlr", b"\x00" * 25), keys, ilst)
+        video = mp4_file(tmp_path / "video.mp4", atom(b"udta", meta))
+        assert metadata._read_mp4_title(video) is None
+
+        monkeypatch.setattr(metadata, "has_mediainfo", lambda: True)
+        monkeypatch.setattr(metadata, "_run_tool", lambda cmd, **kw: subprocess.CompletedProcess(cmd, 0, "From MediaInfo\n", ""))
+        assert metadata.get_mp4_title(video) == "From MediaInfo"
+
+    def test_no_title(self, tmp_path: Path):
+        video = mp4_file(tmp_path / "video.mp4", atom(b"mvhd", b"\x00" * 100))
+        assert metadata.get_mp4_title(video) == ""
+
+    def test_unparseable_file_falls_back_to_mediainfo(self, tmp_path: Path):
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"not an mp4 at all")
+        assert metadata._read_mp4_title(video) is None
+        assert metadata.get_mp4_title(video) == ""
+
+
+class TestCleanMetadataDispatch:
+    """Test format auto-detection in clean_metadata."""
+
+    def test_unsupported_format(self):
+        result = clean_metadata(Path("/fake/video.avi"), "Title")
+        print(result.message)
+        assert result.success and not result.changed
+        assert ".avi" in result.message
+
+
+class TestCleanMetadataBatch:
+    """Test running clean_metadata over many files in a thread pool."""
+
+    def test_every_file_gets_a_result(self, tmp_path: Path, stub_mp4_tools: dict):
+        stub_mp4_tools["title"] = "Show.S01E01.1080p.WEB-DL.x264-GROUP"
+        items = []
+        for n in range(1, 6):
+            video = tmp_path / f"Show - S01E0{n}.mp4"
+            video.write_bytes(b"original")
+            items.append((video, video.stem))
+
+        results = list(clean_metadata_batch(items, workers=3))
+        for result in results:
+            print(f"{result.file_path.name}: {result.message}")
+
+        assert sorted(r.file_path for r in results) == sorted(p for p, _ in items)
+        assert all(r.success and r.changed for r in results)
+        assert len(stub_mp4_tools["calls"]) == len(items)
+
+    def test_largest_mp4_first(self, tmp_path: Path, stub_mp4_tools: dict):
+        stub_mp4_tools["title"] = "Show.S01E01.1080p.WEB-DL.x264-GROUP"
+        items = []
+        for name, size in [("small", 10), ("large", 1000), ("medium", 100)]:
+            video = tmp_path / f"{name}.mp4"
+            video.write_bytes(b"x" * size)
+            items.append((video, name))
+
+        list(clean_metadata_batch(items, workers=1))
+        order = [Path(cmd[cmd.index("-i") + 1]).stem for cmd in stub_mp4_tools["calls"]]
+        print(order)
+        assert order == ["large", "medium", "small"]
+
+    def test_empty_batch(self):
+        assert list(clean_metadata_batch([])) == []
@@ -0,0 +1,164 @@
+"""
+Tests for file discovery and rename operations.
+
+Everything runs against a throwaway directory tree under tmp_path.
+"""
+
+import unicodedata
+from pathlib import Path
+
+import pytest
+from renamer import operations
+from renamer.operations import (
+    DirectoryIndex,
+    find_subtitle_files,
+    find_video_files,
+    rename_companions,
+    safe_rename,
+)
+
+
+def make_tree(base: Path, names: list[str]) -> None:
+    """Create empty files (and their parent folders) under base."""
+    for name in names:
+        path = base / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+
+class TestFindFiles:
+    """Test recursive discovery of video and subtitle files."""
+
+    def test_video_files_any_case_sorted_by_episode(self, tmp_path: Path):
+        make_tree(tmp_path, [
+            "Show.S01E02.mkv",
+            "Show.S01E01.MKV",
+            "Show.S01E03.Mp4",
+            "Show.S01E01.srt",
+            "notes.txt",
+        ])
+        found = [p.name for p in find_video_files(tmp_path)]
+        print(found)
+        assert found == ["Show.S01E01.MKV", "Show.S01E02.mkv", "Show.S01E03.Mp4"]
+
+    def test_recurses_and_skips_directories(self, tmp_path: Path):
+        make_tree(tmp_path, [
+            "Season 01/Show.S01E01.mkv",
+            "Season 02/Extras/Show.S02E01.mkv",
+            "Sample.mkv/readme.txt",  # a folder named like a video
+        ])
+        found = [p.relative_to(tmp_path).as_posix() for p in find_video_files(tmp_path)]
+        print(found)
+        assert found == ["Season 01/Show.S01E01.mkv", "Season 02/Extras/Show.S02E01.mkv"]
+
+    def test_subtitle_files(self, tmp_path: Path):
+        make_tree(tmp_path, ["Show.S01E01.en.srt", "Show.S01E01.ASS", "Show.S01E01.mkv"])
+        found = [p.name for p in find_subtitle_files(tmp_path)]
+        print(found)
+        assert found == ["Show.S01E01.ASS", "Show.S01E01.en.srt"]
+
+
+class TestSafeRename:
+    """Test single-file renames: missing source, collisions, permissions."""
+
+    def test_missing_source(self, tmp_path: Path):
+        result = safe_rename(tmp_path / "gone.mkv", tmp_path / "new.mkv")
+        print(result.message)
+        assert not result.success
+
+    def test_already_correct(self, tmp_path: Path):
+        make_tree(tmp_path, ["A.mkv"])
+        result = safe_rename(tmp_path / "A.mkv", tmp_path / "A.mkv")
+        assert result.success and result.skipped
+
+    @pytest.mark.parametrize("force", [False, True])
+    def test_collision(self, tmp_path: Path, force: bool):
+        make_tree(tmp_path, ["A.mkv", "B.mkv"])
+        result = safe_rename(tmp_path / "A.mkv", tmp_path / "B.mkv", force=force)
+        print(result.message)
+        assert result.success == force
+        assert (tmp_path / "A.mkv").exists() != force
+
+    def test_read_only_source_is_renamed(self, tmp_path: Path):
+        make_tree(tmp_path, ["A.mkv"])
+        (tmp_path / "A.mkv").chmod(0o444)
+        result = safe_rename(tmp_path / "A.mkv", tmp_path / "B.mkv")
+        assert result.success
+        assert (tmp_path / "B.mkv").stat().st_mode & 0o200
+
+    def test_index_tracks_renames_for_collisions(self, tmp_path: Path):
+        """A name freed or taken earlier in the session is seen by later checks."""
+        make_tree(tmp_path, ["A.mkv", "B.mkv"])
+        index = DirectoryIndex()
+
+        assert safe_rename(tmp_path / "A.mkv", tmp_path / "C.mkv", index=index).success
+        blocked = safe_rename(tmp_path / "B.mkv", tmp_path / "C.mkv", index=index)
+        print(blocked.message)
+        assert not blocked.success
+        assert safe_rename(tmp_path / "B.mkv", tmp_path / "A.mkv", index=index).success
+        assert not index.may_exist(tmp_path / "b.MKV")
+        assert index.may_exist(tmp_path / "c.MKV")
+
+    def test_unicode_normalization_collision_is_checked(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Names differing only in NFC/NFD form are one file on APFS: never skip the stat."""
+        nfd = unicodedata.normalize("NFD", "Café.mkv")
+        nfc = unicodedata.normalize("NFC", "Café.mkv")
+        make_tree(tmp_path, [nfd, "A.mkv"])
+        index = DirectoryIndex()
+
+        assert index.may_exist(tmp_path / nfc)
+        assert index.may_exist(tmp_path / "B.mkv")  # any non-ASCII entry forces the stat
+
+        # Stand-in for a normalization-insensitive filesystem
+        real_exists = operations._exists
+        monkeypatch.setattr(operations, "_exists", lambda p: real_exists(p.parent / nfd) if p.name == nfc else real_exists(p))
+        result = safe_rename(tmp_path / "A.mkv", tmp_path / nfc, index=index)
+        print(result.message)
+        assert not result.success
+        assert (tmp_path / "A.mkv").exists()
+
+
+class TestRenameCompanions:
+    """Test renaming of subtitles/NFO/artwork alongside their video."""
+
+    def test_renames_matching_companions(self, tmp_path: Path):
+        make_tree(tmp_path, [
+            "Show.S01E01.720p.mkv",
+            "Show.S01E01.720p.en.srt",
+            "Show.S01E01.720p.nfo",
+            "Show.S01E01.720p.mkv.bak",  # not a companion extension
+            "Show.S01E02.720p.srt",  # another episode
+        ])
+        results = rename_companions(tmp_path / "Show.S01E01.720p.mkv", tmp_path / "Show - S01E01.mkv")
+        for result in results:
+            print(f"{result.old_path.name} -> {result.new_path.name}: {result.message}")
+
+        assert all(r.success for r in results)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "Show - S01E01.en.srt",
+            "Show - S01E01.nfo",
+            "Show.S01E01.720p.mkv",
+            "Show.S01E01.720p.mkv.bak",
+            "Show.S01E02.720p.srt",
+        ]
+
+    def test_shared_index_tracks_renames(self, tmp_path: Path):
+        """One directory read serves every video, and sees earlier renames."""
+        make_tree(tmp_path, ["A.mkv", "A.srt", "B.mkv", "B.srt"])
+        index = DirectoryIndex()
+
+        rename_companions(tmp_path / "A.mkv", tmp_path / "C.mkv", index=index)
+        (tmp_path / "D.srt").write_bytes(b"")  # created after the index was read
+        rename_companions(tmp_path / "B.mkv", tmp_path / "E.mkv", index=index)
+
+        assert index.companions[tmp_path] == ["C.srt", "E.srt"]
+        assert [p.name for p in index.matching(tmp_path, "C")] == ["C.srt"]
+
+    def test_dry_run_renames_nothing(self, tmp_path: Path):
+        make_tree(tmp_path, ["A.mkv", "A.srt"])
+        index = DirectoryIndex()
+        results = rename_companions(tmp_path / "A.mkv", tmp_path / "B.mkv", dry_run=True, index=index)
+
+        assert [r.message for r in results] == ["Would rename"]
+        assert (tmp_path / "A.srt").exists()
+        assert index.companions[tmp_path] == ["A.srt"]
@@ -4,10 +4,18 @@ Jellyfin/Plex Media Renamer
 A smart, cross-platform tool that renames TV show files for media server compatibility.
 """
 
-from importlib.metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("jellyfin-renamer")
-except PackageNotFoundError:
-    # Running from source without installation
-    __version__ = "0.0.0-dev"
+def __getattr__(name: str):
+    # Resolve __version__ lazily (PEP 562): importlib.metadata scans
+    # sys.path for dist-info, which importing the submodules shouldn't pay for.
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
+
+        try:
+            value = version("jellyfin-renamer")
+        except PackageNotFoundError:
+            # Running from source without installation
+            value = "0.0.0-dev"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+from .parser import normalize_text
 
 
 # =============================================================================
@@ -63,19 +66,44 @@ COMMON_TAGS = re.compile(
     re.IGNORECASE
 )
 
+# Both of the above in one pass. The tags are case-insensitive but the
+# release group must stay case-sensitive, so the flag is scoped to the tags.
+RELEASE_GROUP_OR_TAG_PATTERN = re.compile(
+    RELEASE_GROUP_PATTERN.pattern + r'|(?i:' + COMMON_TAGS.pattern + r')'
+)
+
 # Bracket content (usually metadata)
 BRACKET_PATTERN = re.compile(r'\[[^\]]*\]')
 
+# Meaningful parenthetical content to PRESERVE
+# Note: Use [\s._]+ to match dots/underscores since normalization happens later
+MEANINGFUL_PAREN = re.compile(
+    r'\((Part[\s._]+\d+|\d+|Extended[\s._]+Cut|Director\'?s?[\s._]+Cut|Final[\s._]+Cut|Unrated|Theatrical)\)',
+    re.IGNORECASE
+)
+
+# One unit of parenthetical content: a plain character, or a whole nested
+# meaningful parenthetical (kept opaque, so its ")" doesn't close the outer one)
+_PAREN_CONTENT = (
+    r'(?:[^()]|' + MEANINGFUL_PAREN.pattern + r'|(?!' + MEANINGFUL_PAREN.pattern + r')\()'
+)
+
 # Technical parenthetical content
 TECH_PAREN_PATTERN = re.compile(
-    r'\([^)]*(?:720p|1080p|2160p|4K|x264|x265|HEVC|BluRay|WEB|HDTV)[^)]*\)',
+    r'\(' + _PAREN_CONTENT + r'*(?:720p|1080p|2160p|4K|x264|x265|HEVC|BluRay|WEB|HDTV)'
+    + _PAREN_CONTENT + r'*\)',
     re.IGNORECASE
 )
 
-# Meaningful parenthetical content to PRESERVE
-# Note: Use [\s._]+ to match dots/underscores since normalization happens later
-MEANINGFUL_PAREN = re.compile(
-    r'\((Part[\s._]+\d+|\d+|Extended[\s._]+Cut|Director\'?s?[\s._]+Cut|Final[\s._]+Cut|Unrated|Theatrical)\)',
+# Parenthetical at the very end of the title
+TRAILING_PAREN_PATTERN = re.compile(
+    r'\s*(\(' + _PAREN_CONTENT + r'*\))$',
+    re.IGNORECASE
+)
+
+# Unclosed parenthesis at the end
+UNCLOSED_PAREN_PATTERN = re.compile(
+    r'\s*\(' + _PAREN_CONTENT + r'*$',
     re.IGNORECASE
 )
 
@@ -85,6 +113,89 @@ WEB_CODEC_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Trailing metadata, stripped from the first indicator to the end of the title.
+# WEB must run between the two groups: after codecs are gone, before audio,
+# so ".WEB.AAC" is still removed.
+TRAILING_TECH_PATTERN = re.compile(
+    r'[.\s_-]+(?:720p|1080p|2160p|4K|480p|576p'
+    r'|x264|x265|HEVC|H\.?264|H\.?265|XviD|DivX'
+    r'|WEB-DL|WEBRip|BluRay|BDRip|DVDRip|HDTV|PDTV)([.\s_-].*)?$',
+    re.IGNORECASE
+)
+TRAILING_WEB_PATTERN = re.compile(
+    r'[.\s_-]+WEB[.\s_-]+(x264|x265|HEVC|AAC|AC3)([.\s_-].*)?$',
+    re.IGNORECASE
+)
+TRAILING_PLATFORM_AUDIO_PATTERN = re.compile(
+    r'[.\s_-]+(?:AMZN|NFLX|NF|HULU|DSNP|HBO|MAX|HMAX'
+    r'|AAC|AC3|DTS|DDP\d?\.?\d?)([.\s_-].*)?$',
+    re.IGNORECASE
+)
+
+# Title/metadata boundary patterns, in order of reliability
+# (pattern, group whose length is the boundary index)
+BOUNDARY_PATTERNS = [
+    # Quality with dot separator (most reliable)
+    (re.compile(r'^(.+)\.(720p|1080p|2160p|4K|480p|576p)', re.IGNORECASE), 1),
+    # Quality with space and parenthesis
+    (re.compile(r'^(.+)\s+\((720p|1080p|2160p|4K|480p|576p)', re.IGNORECASE), 1),
+    # WEB+codec pattern
+    (re.compile(r'^(.+)\.WEB\.(x264|x265|HEVC|H\.?264|H\.?265)', re.IGNORECASE), 1),
+    # Technical indicators with dot
+    (re.compile(r'^(.+)\.(WEB-DL|BluRay|BDRip|HDTV|x264|x265|HEVC|XviD|DivX)', re.IGNORECASE), 1),
+    # Technical with space and parenthesis
+    (re.compile(r'^(.+)\s+\((WEB-DL|BluRay|BDRip|HDTV|x264|x265|HEVC|XviD|DivX)', re.IGNORECASE), 1),
+    # Platform indicators
+    (re.compile(r'^(.+)\.(AMZN|NFLX|NF|HULU)', re.IGNORECASE), 1),
+]
+
+# Every boundary pattern needs one of these tokens after a "." or "(".
+# One search for it rules out all six patterns when the title has no metadata.
+BOUNDARY_HINT_PATTERN = re.compile(
+    r'[.(](?:720p|1080p|2160p|4K|480p|576p|WEB|BluRay|BDRip|HDTV'
+    r'|x264|x265|HEVC|XviD|DivX|AMZN|NFLX|NF|HULU)',
+    re.IGNORECASE
+)
+
+# DL / DD / DDP abbreviations as standalone tokens
+DL_PATTERN = re.compile(r'(^|[.\s_-])(DL|DDP?)([.\s_-]|$)', re.IGNORECASE)
+
+# Technical abbreviations at start (title is ONLY metadata)
+TECH_PREFIX_PATTERN = re.compile(
+    r'^(720p|1080p|2160p|4K|WEB|BluRay|HDTV|x264|x265|HEVC|XviD|DivX)',
+    re.IGNORECASE
+)
+
+# File extensions that survive into the title (lowercase, without the dot)
+FILE_EXTENSIONS = frozenset({
+    'mkv', 'mp4', 'avi', 'm4v', 'mov', 'wmv', 'flv', 'webm', 'ts', 'm2ts',
+})
+
+# Spacing and punctuation normalization: any run of dots, underscores
+# and whitespace becomes a single space
+SPACING_PATTERN = re.compile(r'[._\s]+')
+
+# Years in series names and leftover year/dash prefixes in titles
+YEAR_PAREN_PATTERN = re.compile(r'\s*\(\d{4}\)')
+LEADING_YEAR_PATTERN = re.compile(r'^\s*\(\d{4}\)\s*-?\s*')
+LEADING_DASHES_PATTERN = re.compile(r'^-\s*-\s*')
+
+# Generic episode references ("episode1", "ep01", "01") after normalization
+GENERIC_EPISODE_PATTERN = re.compile(r'^(episode|ep)?0*\d+$')
+
+# Titles made only of letters and single spaces skip the cleaning passes,
+# unless a word is one of these letter-only indicators or tags
+PLAIN_TITLE_PATTERN = re.compile(r'[A-Za-z]+(?: [A-Za-z]+)*')
+PLAIN_TITLE_STOPWORDS = frozenset({
+    # Codec, source, platform and audio indicators
+    'hevc', 'xvid', 'divx', 'web', 'webrip', 'bluray', 'bdrip', 'dvdrip', 'hdtv', 'pdtv',
+    'amzn', 'nflx', 'nf', 'hulu', 'dsnp', 'hbo', 'max', 'hmax', 'aac', 'dts',
+    'dl', 'dd', 'ddp',
+    # Common tags
+    'fixed', 'repack', 'proper', 'internal', 'extended', 'uncut', 'directors', 'cut',
+    'dubbed', 'subbed',
+})
+
 # Ellipsis placeholder for preservation
 ELLIPSIS_PLACEHOLDER = "THREEDOTSPLACEHOLDER"
 
@@ -96,6 +207,26 @@ class CleanedTitle:
     was_cleaned: bool
 
 
+@dataclass(frozen=True)
+class SeriesContext:
+    """Normalized forms of a series name, used to validate its episode titles."""
+    series_no_year: str
+    norm_series: str
+    norm_series_no_year: str
+
+
+@lru_cache(maxsize=64)
+def _series_context(series_name: str) -> SeriesContext:
+    """Build the SeriesContext for a series name (once per series)."""
+    # Get series without year
+    series_no_year = YEAR_PAREN_PATTERN.sub('', series_name)
+    return SeriesContext(
+        series_no_year=series_no_year,
+        norm_series=normalize_text(series_name),
+        norm_series_no_year=normalize_text(series_no_year),
+    )
+
+
 def protect_ellipsis(text: str) -> str:
     """Replace ... with placeholder to protect during cleaning."""
     return text.replace("...", ELLIPSIS_PLACEHOLDER)
@@ -114,32 +245,34 @@ def find_title_boundary(text: str) -> int | None:
     or None if no clear boundary is found.
     """
     # Protect ellipsis first
-    text = protect_ellipsis(text)
+    return _find_title_boundary(protect_ellipsis(text))
+
+
+def _find_title_boundary(text: str) -> int | None:
+    """find_title_boundary for text whose ellipses are already protected."""
+    if not BOUNDARY_HINT_PATTERN.search(text):
+        return None
 
     # Try each boundary pattern in order of reliability
-    patterns = [
-        # Quality with dot separator (most reliable)
-        (r'^(.+)\.(720p|1080p|2160p|4K|480p|576p)', 1),
-        # Quality with space and parenthesis
-        (r'^(.+)\s+\((720p|1080p|2160p|4K|480p|576p)', 1),
-        # WEB+codec pattern
-        (r'^(.+)\.WEB\.(x264|x265|HEVC|H\.?264|H\.?265)', 1),
-        # Technical indicators with dot
-        (r'^(.+)\.(WEB-DL|BluRay|BDRip|HDTV|x264|x265|HEVC|XviD|DivX)', 1),
-        # Technical with space and parenthesis
-        (r'^(.+)\s+\((WEB-DL|BluRay|BDRip|HDTV|x264|x265|HEVC|XviD|DivX)', 1),
-        # Platform indicators
-        (r'^(.+)\.(AMZN|NFLX|NF|HULU)', 1),
-    ]
-
-    for pattern, group_idx in patterns:
-        match = re.match(pattern, text, re.IGNORECASE)
+    for pattern, group_idx in BOUNDARY_PATTERNS:
+        match = pattern.match(text)
         if match:
             return len(match.group(group_idx))
 
     return None
 
 
+def _is_plain_title(title: str) -> bool:
+    """True if title is plain words that clean_title would return unchanged."""
+    if not PLAIN_TITLE_PATTERN.fullmatch(title):
+        return False
+    if TECH_PREFIX_PATTERN.match(title):
+        return False
+    return PLAIN_TITLE_STOPWORDS.isdisjoint(title.lower().split(' '))
+
+
+# Pure function of its arguments; the same raw titles recur across a library
+@lru_cache(maxsize=4096)
 def clean_title(title: str, series_name: str = "") -> str:
     """
     Clean an episode title by removing technical metadata.
@@ -167,34 +300,38 @@ def clean_title(title: str, series_name: str = "") -> str:
     if series_name:
         title = _remove_series_name(title, series_name)
 
+    # Fast path: nothing below would change a plain title
+    if _is_plain_title(title):
+        return restore_ellipsis(title)
+
     # Try to find a clean boundary
-    boundary = find_title_boundary(title)
+    # (ellipsis is already protected above)
+    boundary = _find_title_boundary(title)
     if boundary and boundary > 2:
         title = title[:boundary]
 
     # Remove technical metadata that might have survived
     title = _strip_technical_metadata(title)
 
-    # Remove release groups
-    title = RELEASE_GROUP_PATTERN.sub('', title)
-
-    # Remove common tags
-    title = COMMON_TAGS.sub('', title)
+    # Remove release groups and common tags
+    title = RELEASE_GROUP_OR_TAG_PATTERN.sub('', title)
 
-    # Remove bracket content
-    title = BRACKET_PATTERN.sub('', title)
+    # Remove bracket content (skip the regex when there is no bracket)
+    if '[' in title:
+        title = BRACKET_PATTERN.sub('', title)
 
     # Remove technical parenthetical content, but protect meaningful ones
     title = _clean_parentheticals(title)
 
     # Remove file extensions
-    title = re.sub(r'\.(mkv|mp4|avi|m4v|mov|wmv|flv|webm|ts|m2ts)$', '', title, flags=re.IGNORECASE)
+    head, dot, ext = title.rpartition('.')
+    if dot and ext.lower() in FILE_EXTENSIONS:
+        title = head
 
     # Normalize spacing and punctuation
-    title = re.sub(r'[._]', ' ', title)
-    title = re.sub(r'\s+', ' ', title)
-    title = title.strip()
-    title = title.strip('-').strip()
+    title = SPACING_PATTERN.sub(' ', title)
+    # (whitespace is only single spaces here)
+    title = title.strip(' -')
 
     # Restore ellipsis
     title = restore_ellipsis(title)
@@ -202,93 +339,79 @@ def clean_title(title: str, series_name: str = "") -> str:
     return title
 
 
+@lru_cache(maxsize=128)
+def _series_regexes(series_name: str) -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Compile the series-prefix patterns for a series name (once per series)."""
+    series_no_year = _series_context(series_name).series_no_year
+
+    # Words may be separated by space, dot, dash or underscore
+    # (Breaking Bad, Breaking.Bad, Breaking-Bad, Breaking_Bad)
+    escaped = '[.\\s_-]'.join(re.escape(word) for word in series_no_year.split())
+    # Remove from beginning with optional year and separator
+    # Handle both bare years (Doctor.Who.2005) and parenthesized years (Pluribus (2025))
+    # Use (?!p) negative lookahead to avoid matching "1080" from "1080p" as a year
+    # Note: In character classes, put - at end to avoid range interpretation
+    return (
+        re.compile(f'^{escaped}[.\\s_-]*\\(\\d{{4}}\\)[.\\s_-]*', re.IGNORECASE),
+        re.compile(f'^{escaped}[.\\s_-]*\\d{{4}}(?!p)[._-]*', re.IGNORECASE),
+        re.compile(f'^{escaped}[._-]*', re.IGNORECASE),
+    )
+
+
 def _remove_series_name(title: str, series_name: str) -> str:
     """Remove series name from beginning of title."""
-    # Get series name without year
-    series_no_year = re.sub(r'\s*\(\d{4}\)', '', series_name)
-
-    # Create variations for matching
-    variations = [
-        series_no_year,
-        series_no_year.replace(' ', '.'),
-        series_no_year.replace(' ', '-'),
-        series_no_year.replace(' ', '_'),
-    ]
-
-    for variant in variations:
-        # Escape for regex
-        escaped = re.escape(variant)
-        # Remove from beginning with optional year and separator
-        # Handle both bare years (Doctor.Who.2005) and parenthesized years (Pluribus (2025))
-        # Use (?!p) negative lookahead to avoid matching "1080" from "1080p" as a year
-        # Note: In character classes, put - at end to avoid range interpretation
-        title = re.sub(f'^{escaped}[.\\s_-]*\\(\\d{{4}}\\)[.\\s_-]*', '', title, flags=re.IGNORECASE)
-        title = re.sub(f'^{escaped}[.\\s_-]*\\d{{4}}(?!p)[._-]*', '', title, flags=re.IGNORECASE)
-        title = re.sub(f'^{escaped}[._-]*', '', title, flags=re.IGNORECASE)
+    for pattern in _series_regexes(series_name):
+        title = pattern.sub('', title)
 
     # Clean up any remaining year at start (with optional leading whitespace)
-    title = re.sub(r'^\s*\(\d{4}\)\s*-?\s*', '', title)
-    title = re.sub(r'^-\s*-\s*', '', title)
+    title = LEADING_YEAR_PATTERN.sub('', title)
+    title = LEADING_DASHES_PATTERN.sub('', title)
 
     return title
 
 
 def _strip_technical_metadata(title: str) -> str:
     """Strip technical metadata patterns from title."""
-    # Order matters: more specific patterns first
-
-    # Quality indicators at end
-    title = re.sub(r'[.\s_-]+(720p|1080p|2160p|4K|480p|576p)([.\s_-].*)?$', '', title, flags=re.IGNORECASE)
+    # Order matters: more specific patterns first. Each pattern cuts from its
+    # leftmost indicator to the end, so indicators are fused only where the
+    # order between them can't change the result.
 
-    # Codec indicators at end
-    title = re.sub(r'[.\s_-]+(x264|x265|HEVC|H\.?264|H\.?265|XviD|DivX)([.\s_-].*)?$', '', title, flags=re.IGNORECASE)
-
-    # Source indicators at end
-    title = re.sub(r'[.\s_-]+(WEB-DL|WEBRip|BluRay|BDRip|DVDRip|HDTV|PDTV)([.\s_-].*)?$', '', title, flags=re.IGNORECASE)
+    # Quality, codec and source indicators at end
+    title = TRAILING_TECH_PATTERN.sub('', title)
 
     # WEB alone when followed by technical indicator (but not alone)
-    title = re.sub(r'[.\s_-]+WEB[.\s_-]+(x264|x265|HEVC|AAC|AC3)([.\s_-].*)?$', '', title, flags=re.IGNORECASE)
-
-    # Platform indicators at end
-    title = re.sub(r'[.\s_-]+(AMZN|NFLX|NF|HULU|DSNP|HBO|MAX|HMAX)([.\s_-].*)?$', '', title, flags=re.IGNORECASE)
+    title = TRAILING_WEB_PATTERN.sub('', title)
 
-    # Audio indicators at end
-    title = re.sub(r'[.\s_-]+(AAC|AC3|DTS|DDP\d?\.?\d?)([.\s_-].*)?$', '', title, flags=re.IGNORECASE)
+    # Platform and audio indicators at end
+    title = TRAILING_PLATFORM_AUDIO_PATTERN.sub('', title)
 
     # DL abbreviation
-    title = re.sub(r'(^|[.\s_-])(DL|DDP?)([.\s_-]|$)', r'\1\3', title, flags=re.IGNORECASE)
+    title = DL_PATTERN.sub(r'\1\3', title)
 
     # Technical abbreviations at start (when title is ONLY metadata)
-    if re.match(r'^(720p|1080p|2160p|4K|WEB|BluRay|HDTV|x264|x265|HEVC|XviD|DivX)', title, re.IGNORECASE):
+    if TECH_PREFIX_PATTERN.match(title):
         return ""
 
     return title
 
 
-def _clean_parentheticals(title: str) -> str:
-    """Remove technical parentheticals while preserving meaningful ones."""
-    # First, protect meaningful parentheticals
-    protected = {}
-    counter = 0
+def _keep_meaningful_paren(match: re.Match) -> str:
+    """re.sub callback: keep the match only if its parenthetical is meaningful."""
+    if MEANINGFUL_PAREN.fullmatch(match.group(1)):
+        return match.group(0)
+    return ''
 
-    for match in MEANINGFUL_PAREN.finditer(title):
-        placeholder = f"__PROT_{counter}__"
-        protected[placeholder] = match.group(0)
-        title = title.replace(match.group(0), placeholder)
-        counter += 1
 
+def _clean_parentheticals(title: str) -> str:
+    """Remove technical parentheticals while preserving meaningful ones."""
     # Remove technical parentheticals
     title = TECH_PAREN_PATTERN.sub('', title)
 
     # Remove any remaining trailing parentheticals (usually technical)
-    title = re.sub(r'\s*\([^)]*\)$', '', title)
+    title = TRAILING_PAREN_PATTERN.sub(_keep_meaningful_paren, title)
 
     # Handle unclosed parenthesis at end
-    title = re.sub(r'\s*\([^)]*$', '', title)
-
-    # Restore protected content
-    for placeholder, original in protected.items():
-        title = title.replace(placeholder, original)
+    title = UNCLOSED_PAREN_PATTERN.sub('', title)
 
     return title
 
@@ -325,15 +448,10 @@ def validate_episode_title(
     title = candidate.strip()
 
     # Normalize for comparison
-    def normalize(s: str) -> str:
-        return re.sub(r'[^a-z0-9]', '', s.lower())
-
-    norm_title = normalize(title)
-    norm_series = normalize(series_name)
-
-    # Get series without year
-    series_no_year = re.sub(r'\s*\(\d{4}\)', '', series_name)
-    norm_series_no_year = normalize(series_no_year)
+    norm_title = normalize_text(title)
+    series = _series_context(series_name)
+    norm_series = series.norm_series
+    norm_series_no_year = series.norm_series_no_year
 
     # Reject if title matches or is contained in series name
     if norm_title == norm_series:
@@ -346,7 +464,7 @@ def validate_episode_title(
         return ""
 
     # Reject generic episode references
-    if re.match(r'^(episode|ep)?0*\d+$', norm_title):
+    if GENERIC_EPISODE_PATTERN.match(norm_title):
         return ""
 
     # Deduplicate within season
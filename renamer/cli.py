@@ -20,7 +20,7 @@ from .operations import (
     find_subtitle_files,
     process_directory,
 )
-from .metadata import clean_metadata, has_mkvpropedit, has_ffmpeg
+from .metadata import clean_metadata_batch, default_worker_count, has_mkvpropedit, has_ffmpeg
 
 
 # =============================================================================
@@ -119,6 +119,13 @@ Supported Episode Patterns:
         help="Clean internal MKV/MP4 metadata and rename companion files",
     )
 
+    parser.add_argument(
+        "--threadcount",
+        metavar="N",
+        type=int,
+        help="Files to deep-clean in parallel (default: half the CPU cores)",
+    )
+
     parser.add_argument(
         "--series",
         metavar="NAME",
@@ -159,6 +166,8 @@ def main(argv: list[str] | None = None) -> int:
     """
     parser = create_parser()
     args = parser.parse_args(argv)
+    if args.threadcount is not None and args.threadcount < 1:
+        parser.error("--threadcount must be at least 1")
 
     # Disable colors if not a TTY
     if not sys.stdout.isatty():
@@ -183,6 +192,10 @@ def main(argv: list[str] | None = None) -> int:
     # Track renamed count (using list to allow mutation in callback)
     renamed_count = [0]
 
+    # Deep-clean jobs collected during renaming, run in parallel afterwards:
+    # file to clean -> (clean title, name to display)
+    metadata_jobs: dict[Path, tuple[str, str]] = {}
+
     # Create result callback - prints each result immediately after processing
     def result_callback(result: RenameResult) -> None:
         if result.success:
@@ -191,17 +204,7 @@ def main(argv: list[str] | None = None) -> int:
                     print_status(Colors.GREEN, f"  Already correct: {result.new_path.name}")
                     # Deep clean even for already-correct files (like bash script does)
                     if args.deep_clean:
-                        clean_title = result.old_path.stem
-                        # Pass verbose callback for detailed output
-                        meta_verbose = verbose_callback if args.verbose else None
-                        meta_result = clean_metadata(result.old_path, clean_title, dry_run=args.dry_run, on_verbose=meta_verbose)
-                        if meta_result.changed:
-                            if args.dry_run:
-                                print_status(Colors.YELLOW, f"    [DRY] Would clean metadata: {result.old_path.name}")
-                            else:
-                                print_status(Colors.GREEN, f"    Cleaned metadata: {result.old_path.name}")
-                        elif args.verbose and meta_result.message:
-                            verbose_callback(f"Metadata: {meta_result.message}")
+                        metadata_jobs[result.old_path] = (result.old_path.stem, result.old_path.name)
                 else:
                     print_status(Colors.YELLOW, f"  Skipped: {result.old_path.name} - {result.message}")
             else:
@@ -215,17 +218,8 @@ def main(argv: list[str] | None = None) -> int:
                 if args.deep_clean:
                     # In dry-run mode, use old_path since file hasn't been renamed yet
                     file_to_clean = result.old_path if args.dry_run else result.new_path
-                    clean_title = result.new_path.stem  # Use the new clean name for title
-                    # Pass verbose callback for detailed output
-                    meta_verbose = verbose_callback if args.verbose else None
-                    meta_result = clean_metadata(file_to_clean, clean_title, dry_run=args.dry_run, on_verbose=meta_verbose)
-                    if meta_result.changed:
-                        if args.dry_run:
-                            print_status(Colors.YELLOW, f"    [DRY] Would clean metadata: {result.new_path.name}")
-                        else:
-                            print_status(Colors.GREEN, f"    Cleaned metadata: {result.new_path.name}")
-                    elif args.verbose and meta_result.message:
-                        verbose_callback(f"Metadata: {meta_result.message}")
+                    # Use the new clean name for title
+                    metadata_jobs[file_to_clean] = (result.new_path.stem, result.new_path.name)
         else:
             print_status(Colors.RED, f"  Error: {result.old_path.name} - {result.message}")
 
@@ -269,6 +263,28 @@ def main(argv: list[str] | None = None) -> int:
 
     results = process_directory(base_path, options)
 
+    # Clean internal metadata for the renamed/already-correct files
+    if metadata_jobs:
+        workers = args.threadcount or default_worker_count()
+        print()
+        print_status(Colors.PURPLE, f"Cleaning internal metadata ({workers} at a time)...")
+        meta_verbose = verbose_callback if args.verbose else None
+        meta_results = clean_metadata_batch(
+            ((path, title) for path, (title, _) in metadata_jobs.items()),
+            workers=workers,
+            dry_run=args.dry_run,
+            on_verbose=meta_verbose,
+        )
+        for meta_result in meta_results:
+            display_name = metadata_jobs[meta_result.file_path][1]
+            if meta_result.changed:
+                if args.dry_run:
+                    print_status(Colors.YELLOW, f"    [DRY] Would clean metadata: {display_name}")
+                else:
+                    print_status(Colors.GREEN, f"    Cleaned metadata: {display_name}")
+            elif args.verbose and meta_result.message:
+                verbose_callback(f"Metadata: {meta_result.message}")
+
     # Summary
     video_count = len(find_video_files(base_path))
     subtitle_count = len(find_subtitle_files(base_path))
@@ -4,17 +4,33 @@ Internal metadata cleaning for video files.
 Wraps mkvpropedit (for MKV) and ffmpeg (for MP4) to clean internal
 metadata like container titles and track names that can show up
 in media server interfaces.
+
+ffmpeg runs single-threaded by default: it only copies streams, and
+clean_metadata_batch already runs several files at once.
 """
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
+import struct
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator
+
+from .parser import normalize_text
+
+try:
+    # Optional: orjson parses faster; stdlib json is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 @dataclass
@@ -26,50 +42,160 @@ class MetadataResult:
     message: str = ""
 
 
+@dataclass
+class MkvTrack:
+    """One track of an MKV file, as reported by mkvmerge -J."""
+    id: int  # mkvmerge's 0-based track ID
+    number: int  # Matroska track number, what mkvpropedit's track:@N selects
+    type: str
+    codec: str = ""
+    name: str = ""
+
+
 # Type alias for verbose callback
 VerboseCallback = Callable[[str], None] | None
 
 
+@lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """shutil.which, once per tool (PATH doesn't change during a run)."""
+    return shutil.which(name)
+
+
+def _tool_path(name: str) -> str:
+    """Absolute path of a tool if found, so it is exec'd without a PATH search."""
+    return _which(name) or name
+
+
 def has_mkvpropedit() -> bool:
     """Check if mkvpropedit is available."""
-    return shutil.which("mkvpropedit") is not None
+    return _which("mkvpropedit") is not None
 
 
 def has_mkvmerge() -> bool:
     """Check if mkvmerge is available."""
-    return shutil.which("mkvmerge") is not None
+    return _which("mkvmerge") is not None
 
 
 def has_ffmpeg() -> bool:
     """Check if ffmpeg is available."""
-    return shutil.which("ffmpeg") is not None
+    return _which("ffmpeg") is not None
 
 
 def has_mediainfo() -> bool:
     """Check if mediainfo is available."""
-    return shutil.which("mediainfo") is not None
+    return _which("mediainfo") is not None
+
+
+def reset_tool_cache() -> None:
+    """Forget which tools were found (PATH is only searched once per run)."""
+    _which.cache_clear()
+
+
+def _run_tool(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run for the external tools.
+
+    With an absolute executable path and close_fds=False, CPython can
+    start the child with posix_spawn. Python's own descriptors are
+    non-inheritable, so nothing leaks into the child.
+    """
+    return subprocess.run(cmd, close_fds=False, **kwargs)
 
 
 def get_mkv_track_info(file_path: Path) -> str:
     """
-    Get full track info from an MKV file using mkvmerge.
+    Get a readable track summary for an MKV file using mkvmerge.
+
+    Returns:
+        One "Track ID N: type (codec)" line per track, or empty string
+        if not available
+    """
+    return format_mkv_tracks(get_mkv_tracks(file_path))
+
+
+def format_mkv_tracks(tracks: list[MkvTrack]) -> str:
+    """One "Track ID N: type (codec)" line per track, plus its name if set."""
+    lines = []
+    for track in tracks:
+        line = f"Track ID {track.id}: {track.type} ({track.codec})"
+        if track.name:
+            line += f' "{track.name}"'
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def get_mkv_tracks(file_path: Path, stat: os.stat_result | None = None) -> list[MkvTrack]:
+    """
+    Get the tracks of an MKV file using mkvmerge -J.
+
+    The mkvmerge output is cached per file and modification time, so
+    asking for the info and then the track IDs runs mkvmerge only once.
+
+    Args:
+        file_path: Path to MKV file
+        stat: The file's stat result, if the caller already has one
 
     Returns:
-        Full mkvmerge -i output, or empty string if not available
+        List of tracks, empty if mkvmerge not available or error
     """
     if not has_mkvmerge():
-        return ""
+        return []
+
+    if stat is not None:
+        mtime_ns = stat.st_mtime_ns
+    else:
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+    return parse_mkv_tracks(_identify_mkv(str(file_path), mtime_ns))
+
+
+def parse_mkv_tracks(output: bytes) -> list[MkvTrack]:
+    """
+    Parse mkvmerge -J output into tracks.
+
+    Returns:
+        List of tracks, empty if the output is empty or not valid JSON
+    """
+    if not output:
+        return []
+
+    try:
+        data = _json_loads(output)
+        tracks = []
+        for entry in data.get("tracks", []):
+            properties = entry.get("properties", {})
+            tracks.append(MkvTrack(
+                id=entry["id"],
+                number=properties.get("number", entry["id"] + 1),
+                type=entry.get("type", ""),
+                codec=entry.get("codec", ""),
+                name=properties.get("track_name", ""),
+            ))
+        return tracks
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return []
+
+
+def clear_track_cache() -> None:
+    """Forget cached mkvmerge output (call after editing an MKV in place)."""
+    _identify_mkv.cache_clear()
+
 
+@lru_cache(maxsize=1024)
+def _identify_mkv(path: str, mtime_ns: int | None) -> bytes:
+    """Run mkvmerge -J; mtime_ns is only part of the cache key."""
     try:
-        result = subprocess.run(
-            ["mkvmerge", "-i", str(file_path)],
+        result = _run_tool(
+            [_tool_path("mkvmerge"), "-J", path],
             capture_output=True,
-            text=True,
             timeout=30,
         )
-        return result.stdout.strip()
+        return result.stdout if result.returncode == 0 else b""
     except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-        return ""
+        return b""
 
 
 def get_mkv_track_ids(file_path: Path) -> list[int]:
@@ -79,30 +205,211 @@ def get_mkv_track_ids(file_path: Path) -> list[int]:
     Returns:
         List of track IDs, empty if mkvmerge not available or error
     """
-    track_info = get_mkv_track_info(file_path)
-    if not track_info:
-        return []
+    return [track.id for track in get_mkv_tracks(file_path)]
 
-    # Parse: "Track ID 0: video ..." -> extract 0
-    track_ids = []
-    for match in re.finditer(r"Track ID (\d+):", track_info):
-        track_ids.append(int(match.group(1)))
-    return track_ids
+
+# Largest moov atom read into memory; real ones are a few MB at most
+MAX_MOOV_SIZE = 64 * 1024 * 1024
+
+# Metadata keys (meta/keys) holding the title: QuickTime's, and the plain
+# one ffmpeg writes with -movflags use_metadata_tags
+MDTA_TITLE_KEYS = (b"com.apple.quicktime.title", b"title")
+
+
+def _iter_atoms(buf: bytes, start: int = 0, end: int | None = None) -> Iterator[tuple[bytes, int, int]]:
+    """
+    Yield (type, body_start, body_end) for each atom in buf[start:end].
+
+    Raises ValueError on a size that doesn't fit, so callers can tell a
+    file they don't understand from one that has no title.
+    """
+    end = len(buf) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", buf, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                raise ValueError("truncated atom header")
+            size, = struct.unpack_from(">Q", buf, offset + 8)
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            raise ValueError(f"bad size for atom {kind!r}")
+        yield kind, offset + header, offset + size
+        offset += size
+
+
+def _read_moov(file_path: Path) -> bytes | None:
+    """Walk the top-level atoms and read just the moov atom."""
+    with open(file_path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset + 8 <= file_size:
+            f.seek(offset)
+            header = f.read(16)
+            size, kind = struct.unpack_from(">I4s", header)
+            header_size = 8
+            if size == 1 and len(header) == 16:
+                size, = struct.unpack_from(">Q", header, 8)
+                header_size = 16
+            elif size == 0:
+                size = file_size - offset
+            if size < header_size:
+                return None
+            if kind == b"moov":
+                if size > MAX_MOOV_SIZE:
+                    return None
+                f.seek(offset + header_size)
+                moov = f.read(size - header_size)
+                return moov if len(moov) == size - header_size else None
+            offset += size
+    return None
+
+
+def _data_atom_text(buf: bytes, start: int, end: int) -> str:
+    """Text of the first UTF-8/UTF-16 'data' atom inside an ilst item."""
+    for kind, body, body_end in _iter_atoms(buf, start, end):
+        if kind == b"data" and body_end - body >= 8:
+            # 1 byte version, 3 bytes type, 4 bytes locale, then the value
+            data_type = int.from_bytes(buf[body + 1:body + 4], "big")
+            value = buf[body + 8:body_end]
+            if data_type == 1:
+                return value.decode("utf-8", "replace")
+            if data_type == 2:
+                return value.decode("utf-16-be", "replace")
+    return ""
+
+
+def _meta_children(buf: bytes, start: int, end: int) -> tuple[int, int]:
+    """Skip an ISO meta atom's version/flags (QuickTime meta has none)."""
+    if buf[start + 4:start + 8] in (b"hdlr", b"keys", b"ilst"):
+        return start, end
+    return start + 4, end
+
+
+def _ilst_title(buf: bytes, start: int, end: int, title_index: int | None = None) -> str:
+    """Find the title in an ilst atom, by ©nam or by mdta key index."""
+    for kind, body, body_end in _iter_atoms(buf, start, end):
+        if kind == b"\xa9nam" or (
+            title_index is not None and int.from_bytes(kind, "big") == title_index
+        ):
+            return _data_atom_text(buf, body, body_end)
+    return ""
+
+
+def _mdta_title_index(buf: bytes, start: int, end: int) -> int | None:
+    """1-based index of the title key in a keys atom, if present."""
+    offset = start + 8  # version/flags, entry count
+    index = 1
+    while offset + 8 <= end:
+        size, = struct.unpack_from(">I", buf, offset)
+        if size < 8:
+            raise ValueError("bad key size")
+        if buf[offset + 8:offset + size] in MDTA_TITLE_KEYS:
+            return index
+        offset += size
+        index += 1
+    return None
+
+
+def _meta_title(buf: bytes, start: int, end: int) -> str | None:
+    """
+    Title from a meta atom's ilst; None if it's keyed and has no title key.
+
+    An ilst next to a keys atom is indexed by key number rather than by
+    ©nam, so without a known title key there's no telling what it holds.
+    """
+    meta_start, meta_end = _meta_children(buf, start, end)
+    keyed = False
+    title_index = None
+    ilst = None
+    for item, item_body, item_end in _iter_atoms(buf, meta_start, meta_end):
+        if item == b"keys":
+            keyed = True
+            title_index = _mdta_title_index(buf, item_body, item_end)
+        elif item == b"ilst":
+            ilst = (item_body, item_end)
+    if ilst is None:
+        return ""
+    if keyed and title_index is None:
+        return None
+    return _ilst_title(buf, *ilst, title_index)
+
+
+def parse_mp4_title(moov: bytes) -> str | None:
+    """
+    Get the title from the body of a moov atom.
+
+    Looks in udta/meta/ilst/©nam (what ffmpeg writes), the older QuickTime
+    udta/©nam, and udta/meta or moov/meta keyed by a title key (see
+    MDTA_TITLE_KEYS).
+
+    Returns:
+        The title, empty string if there is none, or None if there is
+        keyed metadata the reader can't resolve
+
+    Raises:
+        ValueError: if the atoms are malformed
+    """
+    unresolved = False
+    for kind, body, body_end in _iter_atoms(moov):
+        title = ""
+        if kind == b"udta":
+            for child, child_body, child_end in _iter_atoms(moov, body, body_end):
+                if child == b"meta":
+                    title = _meta_title(moov, child_body, child_end)
+                    if title is None:
+                        unresolved = True
+                        title = ""
+                elif child == b"\xa9nam" and child_end - child_body >= 4:
+                    # 2 bytes length, 2 bytes language, then the text
+                    length, = struct.unpack_from(">H", moov, child_body)
+                    text = moov[child_body + 4:child_body + 4 + length]
+                    title = text.decode("utf-8", "replace")
+                if title.strip("\x00 "):
+                    break
+        elif kind == b"meta":
+            title = _meta_title(moov, body, body_end)
+            if title is None:
+                unresolved = True
+                title = ""
+        title = title.strip("\x00 ")
+        if title:
+            return title
+    return None if unresolved else ""
+
+
+def _read_mp4_title(file_path: Path) -> str | None:
+    """Title read straight from the file's atoms; None if that fails."""
+    try:
+        moov = _read_moov(file_path)
+        return parse_mp4_title(moov) if moov is not None else None
+    except (OSError, ValueError, struct.error):
+        return None
 
 
 def get_mp4_title(file_path: Path) -> str:
     """
-    Get current title metadata from MP4 file using mediainfo.
+    Get current title metadata from MP4 file.
+
+    Reads the moov atom directly; mediainfo is only used for files the
+    atom reader can't parse or can't resolve the title key of.
 
     Returns:
         Current title, or empty string if not available
     """
+    title = _read_mp4_title(file_path)
+    if title is not None:
+        return title
+
     if not has_mediainfo():
         return ""
 
     try:
-        result = subprocess.run(
-            ["mediainfo", "--Output=General;%Title%", str(file_path)],
+        result = _run_tool(
+            [_tool_path("mediainfo"), "--Output=General;%Title%", str(file_path)],
             capture_output=True,
             text=True,
             timeout=30,
@@ -125,6 +432,8 @@ def clean_mkv_metadata(
     clean_title: str,
     dry_run: bool = False,
     on_verbose: VerboseCallback = None,
+    *,
+    stat: os.stat_result | None = None,
 ) -> MetadataResult:
     """
     Clean internal metadata from MKV file.
@@ -139,6 +448,7 @@ def clean_mkv_metadata(
         clean_title: Title to set (usually clean filename without extension)
         dry_run: If True, don't make changes
         on_verbose: Optional callback for verbose output
+        stat: The file's stat result, if the caller already has one
 
     Returns:
         MetadataResult with success/failure info
@@ -156,31 +466,43 @@ def clean_mkv_metadata(
 
     verbose(f"Cleaning internal metadata for: {file_path.name}")
 
-    # Get track info for verbose output
-    track_info = get_mkv_track_info(file_path)
-    if track_info:
-        verbose(f"Track info: {track_info}")
+    # One probe feeds both the verbose summary and the track list
+    tracks = get_mkv_tracks(file_path, stat)
+    if on_verbose and tracks:
+        verbose(f"Track info: {format_mkv_tracks(tracks)}")
 
-    # Build command for verbose output
+    # Container title and global tags
     cmd = [
-        "mkvpropedit", "--quiet",
+        _tool_path("mkvpropedit"), "--quiet",
+        str(file_path),
         "--edit", "info", "--set", f"title={clean_title}",
         "--tags", "all:",
-        str(file_path),
     ]
-    verbose(f"Command: {' '.join(cmd)}")
 
-    # Get track IDs
-    track_ids = get_mkv_track_ids(file_path)
-    if track_ids:
-        verbose(f"Found track IDs: {', '.join(str(t) for t in track_ids)}")
-    else:
-        verbose("No track IDs found - track name clearing may not work")
+    if on_verbose:
+        if tracks:
+            verbose(f"Found track IDs: {', '.join(str(t.id) for t in tracks)}")
+        else:
+            verbose("No track IDs found - track name clearing may not work")
+        for track in tracks:
+            if not track.name:
+                verbose(f"Track @{track.number} has no name property to clear")
+
+    # Only tracks that have a name need --delete name
+    named = [track.number for track in tracks if track.name]
+
+    # Track names, cleared in the same mkvpropedit run
+    track_args = []
+    for number in named:
+        track_args += ["--edit", f"track:@{number}", "--delete", "name"]
+    if on_verbose:
+        verbose(f"Command: {' '.join(cmd + track_args)}")
 
     if dry_run:
         # Show what would be cleared
-        for track_id in track_ids:
-            verbose(f"Would clear track @{track_id} name")
+        if on_verbose:
+            for number in named:
+                verbose(f"Would clear track @{number} name")
         return MetadataResult(
             file_path=file_path,
             success=True,
@@ -189,8 +511,32 @@ def clean_mkv_metadata(
         )
 
     try:
+        # One run for everything. Exit code 1 means warnings only.
+        result = _run_tool(cmd + track_args, capture_output=True, text=True, timeout=60)
+        # The file changed; an mtime with coarse resolution may not show it
+        clear_track_cache()
+        if result.returncode in (0, 1):
+            verbose("Container metadata and track names cleaned")
+            return MetadataResult(
+                file_path=file_path,
+                success=True,
+                changed=True,
+                message="Cleaned MKV metadata",
+            )
+
+        if not named:
+            return MetadataResult(
+                file_path=file_path,
+                success=False,
+                message=f"mkvpropedit failed: {result.stderr}",
+            )
+
+        # Retry one step per run so a single failing track doesn't block
+        # the container title
+        verbose("Combined edit failed, retrying container and tracks separately")
+
         # Step 1: Set container title and clear tags
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = _run_tool(cmd, capture_output=True, text=True, timeout=60)
 
         if result.returncode != 0:
             return MetadataResult(
@@ -202,25 +548,25 @@ def clean_mkv_metadata(
         verbose("Container metadata cleaned")
 
         # Step 2: Clear track names
-        for track_id in track_ids:
+        for number in named:
             # Use --delete name to remove track name
             # Exit code 2 means property doesn't exist (not an error)
-            track_result = subprocess.run(
+            track_result = _run_tool(
                 [
-                    "mkvpropedit", "--quiet",
+                    _tool_path("mkvpropedit"), "--quiet",
                     str(file_path),
-                    "--edit", f"track:@{track_id}",
+                    "--edit", f"track:@{number}",
                     "--delete", "name",
                 ],
                 capture_output=True,
                 timeout=30,
             )
             if track_result.returncode == 0:
-                verbose(f"Cleared track @{track_id} name")
+                verbose(f"Cleared track @{number} name")
             elif track_result.returncode == 2:
-                verbose(f"Track @{track_id} has no name property to clear")
+                verbose(f"Track @{number} has no name property to clear")
             else:
-                verbose(f"Failed to clear track @{track_id} name")
+                verbose(f"Failed to clear track @{number} name")
 
         return MetadataResult(
             file_path=file_path,
@@ -243,6 +589,13 @@ def clean_mkv_metadata(
         )
 
 
+# Technical indicators in a normalized (lowercase alphanumeric) title.
+# "web" also covers webrip and webdl.
+TECH_INDICATOR_PATTERN = re.compile(
+    r'720p|1080p|2160p|4k|x26[45]|hevc|h26[45]|web|bluray|hdtv|aac|ac3|dts'
+)
+
+
 def title_needs_cleaning(current_title: str, clean_title: str) -> bool:
     """
     Check if MP4 title needs cleaning.
@@ -256,22 +609,14 @@ def title_needs_cleaning(current_title: str, clean_title: str) -> bool:
         return False
 
     # Normalize for comparison
-    norm_current = re.sub(r'[^a-z0-9]', '', current_title.lower())
-    norm_clean = re.sub(r'[^a-z0-9]', '', clean_title.lower())
+    norm_current = normalize_text(current_title)
 
     # Check for technical indicators
-    tech_indicators = [
-        '720p', '1080p', '2160p', '4k',
-        'x264', 'x265', 'hevc', 'h264', 'h265',
-        'web', 'webrip', 'webdl', 'bluray', 'hdtv',
-        'aac', 'ac3', 'dts',
-    ]
-
-    for indicator in tech_indicators:
-        if indicator in norm_current:
-            return True
+    if TECH_INDICATOR_PATTERN.search(norm_current):
+        return True
 
     # Different from expected clean format
+    norm_clean = normalize_text(clean_title)
     if norm_current != norm_clean and not norm_clean.startswith(norm_current):
         return True
 
@@ -283,6 +628,7 @@ def clean_mp4_metadata(
     clean_title: str,
     dry_run: bool = False,
     on_verbose: VerboseCallback = None,
+    ffmpeg_threads: int = 1,
 ) -> MetadataResult:
     """
     Clean internal metadata from MP4 file.
@@ -295,6 +641,7 @@ def clean_mp4_metadata(
         clean_title: Title to set
         dry_run: If True, don't make changes
         on_verbose: Optional callback for verbose output
+        ffmpeg_threads: ffmpeg -threads value (0 lets ffmpeg pick)
 
     Returns:
         MetadataResult with success/failure info
@@ -331,19 +678,20 @@ def clean_mp4_metadata(
 
     verbose(f"Would change title from: '{current_title}' to: '{clean_title}'")
 
-    # Build command for verbose output
+    # ffmpeg: copy all streams, clear metadata, set title
     cmd = [
-        "ffmpeg", "-hide_banner", "-nostdin", "-v", "error",
+        _tool_path("ffmpeg"), "-hide_banner", "-nostdin", "-v", "error",
         "-i", str(file_path),
         "-map", "0",
         "-c", "copy",
+        "-threads", str(ffmpeg_threads),
         "-map_metadata", "-1",
         "-metadata", f"title={clean_title}",
         "-movflags", "use_metadata_tags",
         "-f", "mp4",
-        "-y", "<temp_file>",
     ]
-    verbose(f"Command: {' '.join(cmd)}")
+    if on_verbose:
+        verbose(f"Command: {' '.join(cmd)} -y <temp_file>")
 
     if dry_run:
         return MetadataResult(
@@ -353,30 +701,18 @@ def clean_mp4_metadata(
             message=f"Would clean MP4 metadata (current: '{current_title}')",
         )
 
+    # Create temp file in same directory to avoid cross-device move issues
+    temp_path = file_path.with_suffix(f".tmp{file_path.suffix}")
+
     try:
-        # Create temp file in same directory to avoid cross-device move issues
-        temp_path = file_path.with_suffix(f".tmp{file_path.suffix}")
-
-        # ffmpeg: copy all streams, clear metadata, set title
-        result = subprocess.run(
-            [
-                "ffmpeg", "-hide_banner", "-nostdin", "-v", "error",
-                "-i", str(file_path),
-                "-map", "0",
-                "-c", "copy",
-                "-map_metadata", "-1",
-                "-metadata", f"title={clean_title}",
-                "-movflags", "use_metadata_tags",
-                "-f", "mp4",
-                "-y", str(temp_path),
-            ],
+        result = _run_tool(
+            cmd + ["-y", str(temp_path)],
             capture_output=True,
             text=True,
             timeout=300,  # 5 minutes for large files
         )
 
         if result.returncode != 0:
-            temp_path.unlink(missing_ok=True)
             return MetadataResult(
                 file_path=file_path,
                 success=False,
@@ -394,7 +730,6 @@ def clean_mp4_metadata(
         )
 
     except subprocess.TimeoutExpired:
-        temp_path.unlink(missing_ok=True)
         return MetadataResult(
             file_path=file_path,
             success=False,
@@ -412,6 +747,13 @@ def clean_mp4_metadata(
             success=False,
             message=f"File operation error: {e}",
         )
+    finally:
+        # Gone already after a successful replace; otherwise never leave
+        # a half-written copy next to the original
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 def clean_metadata(
@@ -419,6 +761,8 @@ def clean_metadata(
     clean_title: str,
     dry_run: bool = False,
     on_verbose: VerboseCallback = None,
+    *,
+    stat: os.stat_result | None = None,
 ) -> MetadataResult:
     """
     Clean metadata from video file (auto-detects format).
@@ -428,6 +772,8 @@ def clean_metadata(
         clean_title: Title to set
         dry_run: If True, don't make changes
         on_verbose: Optional callback for verbose output
+        stat: The file's stat result, if the caller already has one
+            (saves re-stating it; only the MKV probe needs it)
 
     Returns:
         MetadataResult with success/failure info
@@ -435,7 +781,7 @@ def clean_metadata(
     suffix = file_path.suffix.lower()
 
     if suffix == ".mkv":
-        return clean_mkv_metadata(file_path, clean_title, dry_run, on_verbose)
+        return clean_mkv_metadata(file_path, clean_title, dry_run, on_verbose, stat=stat)
     elif suffix in (".mp4", ".m4v"):
         return clean_mp4_metadata(file_path, clean_title, dry_run, on_verbose)
     else:
@@ -445,3 +791,74 @@ def clean_metadata(
             changed=False,
             message=f"Metadata cleaning not supported for {suffix}",
         )
+
+
+def default_worker_count() -> int:
+    """
+    Default number of files to clean at once: half the CPU cores.
+
+    Stream-copy remuxes and mkvpropedit runs are mostly disk-bound, so
+    half the cores leaves I/O headroom.
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def clean_metadata_batch(
+    items: Iterable[tuple[Path, str]],
+    workers: int | None = None,
+    dry_run: bool = False,
+    on_verbose: VerboseCallback = None,
+) -> Iterator[MetadataResult]:
+    """
+    Clean metadata for many files concurrently.
+
+    Each file is an independent mkvpropedit/ffmpeg run, so they are spread
+    over a thread pool (the work happens in subprocesses, outside the GIL).
+    MP4 remuxes are started largest first, so one big file doesn't end up
+    running alone after everything else has finished.
+
+    Args:
+        items: (file path, clean title) pairs
+        workers: Files to process at once (default: default_worker_count())
+        dry_run: If True, don't make changes
+        on_verbose: Optional callback for verbose output (may be called
+            from several threads; messages for different files interleave)
+
+    Yields:
+        MetadataResult for each file, in the order they finish
+    """
+    items = list(items)
+    if not items:
+        return
+    if workers is None:
+        workers = default_worker_count()
+
+    # One lock per file, so a path listed twice is never cleaned concurrently
+    locks = {file_path: threading.Lock() for file_path, _ in items}
+
+    # Estimated cost: an MP4 remux rewrites the whole file, an MKV edit
+    # is roughly constant. The pool hands out jobs in submission order.
+    jobs = []
+    for file_path, clean_title in items:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            stat = None
+        is_mp4 = file_path.suffix.lower() in (".mp4", ".m4v")
+        cost = stat.st_size if stat is not None and is_mp4 else 0
+        jobs.append((cost, file_path, clean_title, stat))
+    jobs.sort(key=lambda job: job[0], reverse=True)
+
+    def clean_one(
+        file_path: Path, clean_title: str, stat: os.stat_result | None
+    ) -> MetadataResult:
+        with locks[file_path]:
+            return clean_metadata(file_path, clean_title, dry_run, on_verbose, stat=stat)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        futures = [
+            executor.submit(clean_one, file_path, clean_title, stat)
+            for _, file_path, clean_title, stat in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -7,11 +7,13 @@ edge cases (like case-insensitive renames on Windows/macOS).
 
 from __future__ import annotations
 
+import bisect
 import os
+import re
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 from .parser import EpisodeInfo, detect_series_name, detect_series_name_no_year, get_season_episode
 from .cleaner import clean_title, validate_episode_title
@@ -47,6 +49,18 @@ VIDEO_EXTENSIONS = {'.mkv', '.mp4', '.avi', '.m4v', '.mov', '.wmv', '.flv', '.we
 SUBTITLE_EXTENSIONS = {'.srt', '.sub', '.ass', '.ssa', '.vtt'}
 COMPANION_EXTENSIONS = {'.srt', '.ass', '.vtt', '.ssa', '.sub', '.idx', '.nfo', '.jpg', '.jpeg', '.png', '.ttml', '.txt', '.sfv', '.srr', '.tbn', '.cue', '.xml', '.mka', '.mks'}
 
+# The same sets without the dot, for checking name.rpartition('.')[2]
+_VIDEO_EXTS = frozenset(ext[1:] for ext in VIDEO_EXTENSIONS)
+_SUBTITLE_EXTS = frozenset(ext[1:] for ext in SUBTITLE_EXTENSIONS)
+_COMPANION_EXTS = frozenset(ext[1:] for ext in COMPANION_EXTENSIONS)
+
+# Episode markers stripped from a filename before title cleaning.
+# Applied in this order by get_episode_title.
+STRIP_SXXEXX_PATTERN = re.compile(r'[Ss]\d{1,2}[\s_.-]*[Ee]\d{1,3}[\s_.-]*')
+STRIP_NXNN_PATTERN = re.compile(r'\d{1,2}x\d{2,3}[\s_.-]*')
+STRIP_EXX_PATTERN = re.compile(r'[Ee]\d{1,3}[\s_.-]*')
+STRIP_ANIME_PATTERN = re.compile(r'-\s*\d{1,3}\s*(?=[\[\(.])')
+
 
 @dataclass
 class RenameResult:
@@ -75,28 +89,214 @@ class RenameOptions:
     on_result: Callable[["RenameResult"], None] | None = None  # Called after each file
 
 
+def _is_companion_name(name: str) -> bool:
+    head, dot, ext = name.rpartition('.')
+    # Leading dots don't start an extension (".srt" has none), as in Path.suffix
+    return bool(dot) and bool(head.lstrip('.')) and ext.lower() in _COMPANION_EXTS
+
+
+def _collision_key(name: str) -> str | None:
+    """
+    Lowercased name for ASCII names; None (one shared bucket) otherwise.
+
+    Only ASCII has one case-folding rule every filesystem agrees on. APFS,
+    for one, also treats NFC and NFD spellings of "Café" as the same name.
+    """
+    return name.lower() if name.isascii() else None
+
+
+@dataclass
+class DirectoryIndex:
+    """
+    Names in each directory, listed once per directory.
+
+    Keeps the sorted companion-file names, so rename_companions can find
+    "<video stem>*" files with a bisect, and a count of every name by
+    _collision_key, so safe_rename can skip the stat for a destination
+    that can't exist. Renames made through safe_rename are recorded, so
+    the index stays in sync with the session's own changes.
+    """
+    companions: dict[Path, list[str]] = field(default_factory=dict)
+    lower_names: dict[Path, dict[str | None, int]] = field(default_factory=dict)
+
+    def _load(self, directory: Path) -> None:
+        if directory in self.lower_names:
+            return
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            entries = []
+        self.companions[directory] = sorted(name for name in entries if _is_companion_name(name))
+        counts: dict[str | None, int] = {}
+        for name in entries:
+            key = _collision_key(name)
+            counts[key] = counts.get(key, 0) + 1
+        self.lower_names[directory] = counts
+
+    def matching(self, directory: Path, prefix: str) -> list[Path]:
+        """Companion files in directory whose name starts with prefix."""
+        self._load(directory)
+        names = self.companions[directory]
+        start = bisect.bisect_left(names, prefix)
+        matches = []
+        for name in names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.append(directory / name)
+        return matches
+
+    def may_exist(self, path: Path) -> bool:
+        """
+        False only if no name in the directory can match, ignoring case.
+
+        A True answer still needs a real stat: whether "show.mkv" blocks
+        "Show.mkv" depends on the filesystem. Non-ASCII names, on either
+        side, always get the stat.
+        """
+        self._load(path.parent)
+        counts = self.lower_names[path.parent]
+        key = _collision_key(path.name)
+        return key is None or None in counts or key in counts
+
+    def moved(self, old_path: Path, new_path: Path) -> None:
+        """Record a rename so later lookups see the new name."""
+        for directory, name, delta in ((old_path.parent, old_path.name, -1), (new_path.parent, new_path.name, 1)):
+            counts = self.lower_names.get(directory)
+            if counts is None:
+                continue
+            # Over-counting (an overwritten destination) only costs a stat
+            key = _collision_key(name)
+            count = counts.get(key, 0) + delta
+            if count > 0:
+                counts[key] = count
+            else:
+                counts.pop(key, None)
+
+            if _is_companion_name(name):
+                names = self.companions[directory]
+                index = bisect.bisect_left(names, name)
+                present = index < len(names) and names[index] == name
+                if delta < 0 and present:
+                    del names[index]
+                elif delta > 0 and not present:
+                    names.insert(index, name)
+
+
+def _no_verbose(msg: str) -> None:
+    pass
+
+
 @dataclass
 class RenameSession:
     """Tracks state across a rename session."""
     base_path: Path
     options: RenameOptions
     series_name: str = ""
+    series_no_year: str = ""
     seen_titles: set[str] = field(default_factory=set)
     results: list[RenameResult] = field(default_factory=list)
+    directory_index: DirectoryIndex = field(default_factory=DirectoryIndex)
+    # Verbose output callback, bound once (a no-op when not verbose)
+    verbose: Callable[[str], None] = field(init=False, repr=False)
 
     def __post_init__(self):
-        # Helper for verbose output
-        def verbose(msg: str) -> None:
-            if self.options.on_verbose:
-                self.options.on_verbose(msg)
+        self.verbose = self.options.on_verbose or _no_verbose
 
         # Auto-detect series name if not provided
         if self.options.series_name:
             self.series_name = self.options.series_name
-            verbose(f"Using provided series name: '{self.series_name}'")
+            self.verbose(f"Using provided series name: '{self.series_name}'")
         else:
             self.series_name = detect_series_name(self.base_path)
-            verbose(f"Auto-detected series name: '{self.series_name}'")
+            self.verbose(f"Auto-detected series name: '{self.series_name}'")
+
+        # Folder name without year, for the formats that drop it
+        self.series_no_year = detect_series_name_no_year(self.base_path) if self.series_name else ""
+
+
+# One builder per output format. Each takes (series_name, series_no_year,
+# season_episode, title, extension) and falls back to shorter forms when
+# the series name or the title is missing.
+
+def _format_show_year_sxxexx_title(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    if title and series_name:
+        return f"{series_name} - {season_episode} - {title}.{extension}"
+    elif series_name:
+        return f"{series_name} - {season_episode}.{extension}"
+    elif title:
+        return f"{season_episode} - {title}.{extension}"
+    else:
+        return f"{season_episode}.{extension}"
+
+
+def _format_show_year_sxxexx(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    if series_name:
+        return f"{series_name} - {season_episode}.{extension}"
+    else:
+        return f"{season_episode}.{extension}"
+
+
+def _format_show_sxxexx_title(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    if title and series_no_year:
+        return f"{series_no_year} - {season_episode} - {title}.{extension}"
+    elif series_no_year:
+        return f"{series_no_year} - {season_episode}.{extension}"
+    elif title:
+        return f"{season_episode} - {title}.{extension}"
+    else:
+        return f"{season_episode}.{extension}"
+
+
+def _format_show_sxxexx(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    if series_no_year:
+        return f"{series_no_year} - {season_episode}.{extension}"
+    else:
+        return f"{season_episode}.{extension}"
+
+
+def _format_sxxexx_title(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    if title:
+        return f"{season_episode} - {title}.{extension}"
+    else:
+        return f"{season_episode}.{extension}"
+
+
+def _format_sxxexx(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    return f"{season_episode}.{extension}"
+
+
+def _format_default(
+    series_name: str, series_no_year: str, season_episode: str, title: str | None, extension: str
+) -> str:
+    # Fallback for unknown format strings
+    if title and series_name:
+        return f"{series_name} - {season_episode} - {title}.{extension}"
+    elif series_name:
+        return f"{series_name} - {season_episode}.{extension}"
+    else:
+        return f"{season_episode}.{extension}"
+
+
+_FORMAT_BUILDERS: dict[str, Callable[[str, str, str, str | None, str], str]] = {
+    OutputFormat.SHOW_YEAR_SXXEXX_TITLE: _format_show_year_sxxexx_title,
+    OutputFormat.SHOW_YEAR_SXXEXX: _format_show_year_sxxexx,
+    OutputFormat.SHOW_SXXEXX_TITLE: _format_show_sxxexx_title,
+    OutputFormat.SHOW_SXXEXX: _format_show_sxxexx,
+    OutputFormat.SXXEXX_TITLE: _format_sxxexx_title,
+    OutputFormat.SXXEXX: _format_sxxexx,
+}
 
 
 def build_filename(
@@ -105,7 +305,7 @@ def build_filename(
     extension: str,
     series_name: str,
     output_format: str,
-    base_path: Path,
+    series_no_year: str,
 ) -> str:
     """
     Build the output filename based on format string.
@@ -116,74 +316,39 @@ def build_filename(
         extension: File extension (without dot)
         series_name: Series name (may include year)
         output_format: One of the OutputFormat constants
-        base_path: Base path for series name detection
+        series_no_year: Series name without year (see RenameSession)
 
     Returns:
         Formatted filename
     """
     season_episode = episode_info.format_code()
-
-    # Get series name without year for certain formats
-    series_no_year = detect_series_name_no_year(base_path) if series_name else ""
-
-    match output_format:
-        case OutputFormat.SHOW_YEAR_SXXEXX_TITLE:
-            if title and series_name:
-                return f"{series_name} - {season_episode} - {title}.{extension}"
-            elif series_name:
-                return f"{series_name} - {season_episode}.{extension}"
-            elif title:
-                return f"{season_episode} - {title}.{extension}"
-            else:
-                return f"{season_episode}.{extension}"
-
-        case OutputFormat.SHOW_YEAR_SXXEXX:
-            if series_name:
-                return f"{series_name} - {season_episode}.{extension}"
-            else:
-                return f"{season_episode}.{extension}"
-
-        case OutputFormat.SHOW_SXXEXX_TITLE:
-            if title and series_no_year:
-                return f"{series_no_year} - {season_episode} - {title}.{extension}"
-            elif series_no_year:
-                return f"{series_no_year} - {season_episode}.{extension}"
-            elif title:
-                return f"{season_episode} - {title}.{extension}"
-            else:
-                return f"{season_episode}.{extension}"
-
-        case OutputFormat.SHOW_SXXEXX:
-            if series_no_year:
-                return f"{series_no_year} - {season_episode}.{extension}"
-            else:
-                return f"{season_episode}.{extension}"
-
-        case OutputFormat.SXXEXX_TITLE:
-            if title:
-                return f"{season_episode} - {title}.{extension}"
-            else:
-                return f"{season_episode}.{extension}"
-
-        case OutputFormat.SXXEXX:
-            return f"{season_episode}.{extension}"
-
-        case _:
-            # Default fallback
-            if title and series_name:
-                return f"{series_name} - {season_episode} - {title}.{extension}"
-            elif series_name:
-                return f"{series_name} - {season_episode}.{extension}"
-            else:
-                return f"{season_episode}.{extension}"
+    builder = _FORMAT_BUILDERS.get(output_format, _format_default)
+    return builder(series_name, series_no_year, season_episode, title, extension)
 
 
 def is_case_only_rename(old_path: Path, new_path: Path) -> bool:
     """Check if this is a case-only rename on a case-insensitive filesystem."""
-    return (
-        old_path != new_path and
-        str(old_path).lower() == str(new_path).lower()
-    )
+    if old_path == new_path:
+        return False
+    old, new = str(old_path), str(new_path)
+    # Lowercasing keeps ASCII lengths, so different lengths can't match
+    if len(old) != len(new) and old.isascii() and new.isascii():
+        return False
+    # Usually only the file name differs; don't lowercase the whole path
+    old_dir, old_name = os.path.split(old)
+    new_dir, new_name = os.path.split(new)
+    if old_dir == new_dir:
+        return old_name.lower() == new_name.lower()
+    return old.lower() == new.lower()
+
+
+def _exists(path: Path) -> bool:
+    """Path.exists() as a single stat call."""
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
 
 
 def safe_rename(
@@ -191,6 +356,7 @@ def safe_rename(
     new_path: Path,
     dry_run: bool = False,
     force: bool = False,
+    index: DirectoryIndex | None = None,
 ) -> RenameResult:
     """
     Safely rename a file with collision and permission handling.
@@ -205,12 +371,16 @@ def safe_rename(
         new_path: Destination file path
         dry_run: If True, don't actually rename
         force: If True, overwrite existing files
+        index: Shared directory index; lets the collision check skip the
+            stat when no file of that name (in any case) exists
 
     Returns:
         RenameResult with success/failure info
     """
-    # Source doesn't exist
-    if not old_path.exists():
+    # Source doesn't exist (one stat, reused for the permission check)
+    try:
+        old_stat = os.stat(old_path)
+    except OSError:
         return RenameResult(
             old_path=old_path,
             new_path=new_path,
@@ -228,8 +398,9 @@ def safe_rename(
             message="Already correct",
         )
 
-    # Check for collision
-    if new_path.exists() and not is_case_only_rename(old_path, new_path):
+    # Check for collision (a case-only rename "collides" with itself)
+    case_only = is_case_only_rename(old_path, new_path)
+    if not case_only and (index is None or index.may_exist(new_path)) and _exists(new_path):
         if not force:
             return RenameResult(
                 old_path=old_path,
@@ -249,19 +420,22 @@ def safe_rename(
 
     try:
         # Fix permissions if needed
-        if not os.access(old_path, os.W_OK):
+        if not old_stat.st_mode & 0o200:
             try:
-                old_path.chmod(old_path.stat().st_mode | 0o200)
+                os.chmod(old_path, old_stat.st_mode | 0o200)
             except OSError:
                 pass
 
         # Handle case-only renames with two-step process
-        if is_case_only_rename(old_path, new_path):
+        if case_only:
             tmp_path = new_path.with_suffix(new_path.suffix + ".__tmp__")
-            old_path.rename(tmp_path)
-            tmp_path.rename(new_path)
+            os.rename(old_path, tmp_path)
+            os.rename(tmp_path, new_path)
         else:
-            old_path.rename(new_path)
+            os.rename(old_path, new_path)
+
+        if index is not None:
+            index.moved(old_path, new_path)
 
         return RenameResult(
             old_path=old_path,
@@ -283,6 +457,7 @@ def rename_companions(
     old_video: Path,
     new_video: Path,
     dry_run: bool = False,
+    index: DirectoryIndex | None = None,
 ) -> list[RenameResult]:
     """
     Rename companion files (subtitles, NFO, artwork) to match video.
@@ -293,6 +468,7 @@ def rename_companions(
         old_video: Original video path
         new_video: New video path
         dry_run: If True, don't actually rename
+        index: Shared directory index (default: list the directory now)
 
     Returns:
         List of RenameResults for each companion file
@@ -303,30 +479,34 @@ def rename_companions(
     new_base = new_video.stem
     directory = old_video.parent
 
-    for path in directory.iterdir():
+    if index is None:
+        index = DirectoryIndex()
+
+    # Must start with old video base name (and have a whitelisted extension)
+    for path in index.matching(directory, old_base):
         # Skip the video file itself
         if path == old_video:
             continue
 
-        # Only process whitelisted extensions
-        if path.suffix.lower() not in COMPANION_EXTENSIONS:
-            continue
-
-        # Must start with old video base name
-        if not path.name.startswith(old_base):
-            continue
-
         # Preserve suffix after base name (language codes, etc.)
         suffix = path.name[len(old_base):]
         new_name = f"{new_base}{suffix}"
         new_path = directory / new_name
 
-        result = safe_rename(path, new_path, dry_run=dry_run)
+        result = safe_rename(path, new_path, dry_run=dry_run, index=index)
         results.append(result)
 
     return results
 
 
+def _stem(filename: str) -> str:
+    """Path(filename).stem, without building a Path for a bare file name."""
+    if filename in ('', '.') or os.sep in filename or (os.altsep and os.altsep in filename):
+        return Path(filename).stem
+    dot = filename.rfind('.')
+    return filename[:dot] if 0 < dot < len(filename) - 1 else filename
+
+
 def get_episode_title(
     filename: str,
     episode_info: EpisodeInfo,
@@ -348,20 +528,18 @@ def get_episode_title(
     Returns:
         Cleaned episode title, or empty string if none found
     """
-    import re
-
     # Remove extension
-    title = Path(filename).stem
+    title = _stem(filename)
 
     # Remove episode pattern from title
     # S01E01 pattern
-    title = re.sub(r'[Ss]\d{1,2}[\s_.-]*[Ee]\d{1,3}[\s_.-]*', '', title)
+    title = STRIP_SXXEXX_PATTERN.sub('', title)
     # NxNN pattern
-    title = re.sub(r'\d{1,2}x\d{2,3}[\s_.-]*', '', title)
+    title = STRIP_NXNN_PATTERN.sub('', title)
     # E## pattern
-    title = re.sub(r'[Ee]\d{1,3}[\s_.-]*', '', title)
+    title = STRIP_EXX_PATTERN.sub('', title)
     # Anime pattern
-    title = re.sub(r'-\s*\d{1,3}\s*(?=[\[\(.])', '', title)
+    title = STRIP_ANIME_PATTERN.sub('', title)
 
     # Clean the title
     title = clean_title(title, series_name)
@@ -386,29 +564,61 @@ def _episode_sort_key(path: Path) -> tuple:
     This ensures files are grouped by directory, then ordered by episode number,
     regardless of filename case.
     """
-    episode_info = get_season_episode(path.name)
+    return _sort_key(str(path.parent).lower(), path.name)
+
+
+def _sort_key(parent_lower: str, name: str) -> tuple:
+    """_episode_sort_key with the lowercased parent already worked out."""
+    episode_info = get_season_episode(name)
     if episode_info:
-        return (str(path.parent).lower(), episode_info.season, episode_info.episode, path.name.lower())
+        return (parent_lower, episode_info.season, episode_info.episode, name.lower())
     # Fallback for non-episode files: sort by path, then name
-    return (str(path.parent).lower(), 999, 999, path.name.lower())
+    return (parent_lower, 999, 999, name.lower())
+
+
+def _find_batches(base_path: Path, extensions: frozenset[str]) -> Iterator[list[Path]]:
+    """
+    Find files in the tree whose extension (any case, no dot) is in extensions.
+
+    One os.walk over the tree; symlinked directories aren't followed,
+    same as rglob. Yields one sorted list per directory (directories
+    whose paths differ only in case share a list), in _episode_sort_key
+    order overall. Only the matching names are kept for the whole tree;
+    Paths and sort keys are built one directory at a time.
+    """
+    found: dict[str, list[tuple[Path, list[str]]]] = {}
+    for root, _dirs, names in os.walk(base_path):
+        matched = []
+        for name in names:
+            _, dot, ext = name.rpartition('.')
+            if dot and ext.lower() in extensions:
+                matched.append(name)
+        if matched:
+            directory = Path(root)
+            found.setdefault(str(directory).lower(), []).append((directory, matched))
+
+    for parent_lower in sorted(found):
+        keyed = [
+            (_sort_key(parent_lower, name), directory / name)
+            for directory, names in found.pop(parent_lower)
+            for name in names
+        ]
+        keyed.sort(key=lambda entry: entry[0])
+        yield [path for _, path in keyed]
+
+
+def _find_files(base_path: Path, extensions: frozenset[str]) -> list[Path]:
+    return [path for batch in _find_batches(base_path, extensions) for path in batch]
 
 
 def find_video_files(base_path: Path) -> list[Path]:
     """Find all video files in directory tree."""
-    files = []
-    for ext in VIDEO_EXTENSIONS:
-        files.extend(base_path.rglob(f"*{ext}"))
-        files.extend(base_path.rglob(f"*{ext.upper()}"))
-    return sorted(set(files), key=_episode_sort_key)
+    return _find_files(base_path, _VIDEO_EXTS)
 
 
 def find_subtitle_files(base_path: Path) -> list[Path]:
     """Find all subtitle files in directory tree."""
-    files = []
-    for ext in SUBTITLE_EXTENSIONS:
-        files.extend(base_path.rglob(f"*{ext}"))
-        files.extend(base_path.rglob(f"*{ext.upper()}"))
-    return sorted(set(files), key=_episode_sort_key)
+    return _find_files(base_path, _SUBTITLE_EXTS)
 
 
 def process_video_file(
@@ -428,10 +638,7 @@ def process_video_file(
     filename = file_path.name
     extension = file_path.suffix.lstrip('.')
 
-    # Helper for verbose output
-    def verbose(msg: str) -> None:
-        if session.options.on_verbose:
-            session.options.on_verbose(msg)
+    verbose = session.verbose
 
     verbose(f"Processing file: {filename}")
 
@@ -473,7 +680,7 @@ def process_video_file(
         extension,
         session.series_name,
         session.options.output_format,
-        session.base_path,
+        session.series_no_year,
     )
     new_path = file_path.parent / new_filename
 
@@ -485,6 +692,7 @@ def process_video_file(
         new_path,
         dry_run=session.options.dry_run,
         force=session.options.force,
+        index=session.directory_index,
     )
 
     # Rename companions if successful (including for "Already correct" files)
@@ -494,6 +702,7 @@ def process_video_file(
             file_path,
             new_path,
             dry_run=session.options.dry_run,
+            index=session.directory_index,
         )
         # Print companion results like bash script does
         for comp_result in companion_results:
@@ -526,12 +735,12 @@ def process_directory(
     """
     session = RenameSession(base_path=base_path, options=options)
 
-    # Find and process video files
-    video_files = find_video_files(base_path)
-
-    for file_path in video_files:
-        result = process_video_file(file_path, session)
-        if result:
-            session.results.append(result)
+    # Find and process video files, one directory at a time (same order
+    # as find_video_files, without holding every Path at once)
+    for batch in _find_batches(base_path, _VIDEO_EXTS):
+        for file_path in batch:
+            result = process_video_file(file_path, session)
+            if result:
+                session.results.append(result)
 
     return session.results
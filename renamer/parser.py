@@ -11,13 +11,15 @@ from filenames. These patterns have been carefully tuned to handle:
 from __future__ import annotations
 
 import re
+import string
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True)
 class EpisodeInfo:
-    """Parsed episode information."""
+    """Parsed episode information (immutable, so cached results can be shared)."""
     season: int
     episode: int
 
@@ -58,6 +60,43 @@ PATTERN_ANIME = re.compile(
 )
 
 
+# =============================================================================
+# SERIES NAME PATTERNS
+# Used to derive the series name from the folder structure
+# =============================================================================
+
+# Season subfolders: "Season 1", "season 05", "S01"
+PATTERN_ANY_SEASON_DIR = re.compile(r'^[Ss](?:eason\s*)?\d+$')
+
+# Specials subfolders: "Specials", "Special"
+PATTERN_SPECIALS_DIR = re.compile(r'^[Ss]pecials?$')
+
+# Season indicators trailing the series name ("Show - Season 1", "Show S01")
+PATTERN_SEASON_SUFFIX = re.compile(r'\s*-\s*[Ss]eason.*$')
+PATTERN_SHORT_SEASON_SUFFIX = re.compile(r'\s*[Ss]\d+.*$')
+
+# Year suffixes: "(2008)", "(1999)", "[2008]"; cuts from the earliest
+# one to the end of the name
+PATTERN_YEAR_SUFFIX = re.compile(r'\s*(?:\((?:2\d{3}|19\d{2})\)|\[\d{4}\]).*$')
+
+# Separator cleanup
+PATTERN_DOT_UNDERSCORE = re.compile(r'[._]')
+PATTERN_WHITESPACE = re.compile(r'\s+')
+
+# Everything that isn't lowercase alphanumeric (for normalize_text)
+PATTERN_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+# bytes.translate tables for the ASCII fast path of normalize_text:
+# fold A-Z to lowercase and delete everything that isn't alphanumeric
+_ASCII_LOWER = bytes.maketrans(
+    string.ascii_uppercase.encode(), string.ascii_lowercase.encode()
+)
+_ASCII_NON_ALNUM = bytes(
+    c for c in range(256) if chr(c) not in string.ascii_letters + string.digits
+)
+
+
+@lru_cache(maxsize=4096)
 def get_season_episode(filename: str, anime_mode: bool = False) -> EpisodeInfo | None:
     """
     Extract season and episode numbers from a filename.
@@ -126,6 +165,7 @@ def get_season_episode(filename: str, anime_mode: bool = False) -> EpisodeInfo |
     return None
 
 
+@lru_cache(maxsize=256)
 def detect_series_name(base_path: Path) -> str:
     """
     Auto-detect series name from folder structure.
@@ -144,28 +184,29 @@ def detect_series_name(base_path: Path) -> str:
     parent_name = base_path.name
 
     # Check if we're in a Season/season folder
-    if re.match(r'^[Ss]eason\s*\d+$', parent_name) or re.match(r'^[Ss]\d+$', parent_name):
+    if PATTERN_ANY_SEASON_DIR.match(parent_name):
         # Go up one level for series name
         parent_name = base_path.parent.name
 
     # Check for Specials folder
-    if re.match(r'^[Ss]pecials?$', parent_name):
+    if PATTERN_SPECIALS_DIR.match(parent_name):
         parent_name = base_path.parent.name
 
     clean_name = parent_name
 
     # Remove season indicators but keep year
-    clean_name = re.sub(r'\s*-\s*[Ss]eason.*$', '', clean_name)
-    clean_name = re.sub(r'\s*[Ss]\d+.*$', '', clean_name)
+    clean_name = PATTERN_SEASON_SUFFIX.sub('', clean_name)
+    clean_name = PATTERN_SHORT_SEASON_SUFFIX.sub('', clean_name)
 
     # Clean up dots, underscores, normalize spacing
-    clean_name = re.sub(r'[._]', ' ', clean_name)
-    clean_name = re.sub(r'\s+', ' ', clean_name)
+    clean_name = PATTERN_DOT_UNDERSCORE.sub(' ', clean_name)
+    clean_name = PATTERN_WHITESPACE.sub(' ', clean_name)
     clean_name = clean_name.strip()
 
     return clean_name
 
 
+@lru_cache(maxsize=256)
 def detect_series_name_no_year(base_path: Path) -> str:
     """
     Auto-detect series name without year suffix.
@@ -179,18 +220,20 @@ def detect_series_name_no_year(base_path: Path) -> str:
     clean_name = detect_series_name(base_path)
 
     # Remove year patterns
-    clean_name = re.sub(r'\s*\(2\d{3}\).*$', '', clean_name)
-    clean_name = re.sub(r'\s*\(19\d{2}\).*$', '', clean_name)
-    clean_name = re.sub(r'\s*\[\d{4}\].*$', '', clean_name)
+    clean_name = PATTERN_YEAR_SUFFIX.sub('', clean_name)
     clean_name = clean_name.strip()
 
     return clean_name
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """
     Normalize text for comparison (lowercase, alphanumeric only).
 
     Used for fuzzy matching series names and titles.
     """
-    return re.sub(r'[^a-z0-9]', '', text.lower())
+    if text.isascii():
+        # Single C-level pass: lowercase and strip in one translate
+        return text.encode('ascii').translate(_ASCII_LOWER, _ASCII_NON_ALNUM).decode('ascii')
+    return PATTERN_NON_ALNUM.sub('', text.lower())